@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the benchmark scripts
+
+Latency summaries in the same shape for every benchmark (so JSON results can be
+diffed between revisions) and in-process loading of the orchestrator servers,
+which expect to run with orchestrator/ as the working directory and import
+their sibling modules (tracing, transport) from it.
+
+Updated: 2026-10-18 19:58:06 UTC
+"""
+
+import importlib.util
+import os
+import statistics
+import sys
+from pathlib import Path
+from types import ModuleType
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+ORCHESTRATOR_DIR = REPO_ROOT / 'orchestrator'
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Summarize latency samples (milliseconds): p50, p99, mean and sample count."""
+    if not samples:
+        return {"p50_ms": 0.0, "p99_ms": 0.0, "mean_ms": 0.0, "iterations": 0}
+
+    ordered = sorted(samples)
+    return {
+        "p50_ms": round(statistics.median(ordered), 3),
+        "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 3),
+        "mean_ms": round(statistics.fmean(ordered), 3),
+        "iterations": len(ordered)
+    }
+
+
+def load_server(module_name: str, filename: str) -> ModuleType:
+    """Import an orchestrator server module in-process (cwd and sys.path set as the MCP launcher does)."""
+    os.chdir(ORCHESTRATOR_DIR)
+    if str(ORCHESTRATOR_DIR) not in sys.path:
+        sys.path.insert(0, str(ORCHESTRATOR_DIR))
+
+    spec = importlib.util.spec_from_file_location(module_name, ORCHESTRATOR_DIR / filename)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def server_command(filename: str) -> list[str]:
+    """Command line that starts a server over stdio the way the plugin MCP config does (run with cwd=ORCHESTRATOR_DIR)."""
+    return [sys.executable, '-c', f"exec(open({filename!r}).read())"]
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Hook overhead benchmark
+
+Measures the wall-clock cost of one ping-pong hook invocation per event type,
+the way Claude Code runs it (fresh process, JSON on stdin), against a scratch
+CLAUDE_PLUGIN_ROOT. The bare `python3 -S -c pass` startup is reported as the
+floor. Pass --baseline to time another hook command on the same payloads,
+e.g. the previous bash implementation:
+
+    git show <rev>:orchestrator/hooks/ping-pong.sh > /tmp/ping-pong.sh
+    python3 benchmarks/hook_overhead.py --baseline "bash /tmp/ping-pong.sh"
+
+Results are printed as JSON (milliseconds).
+
+Updated: 2026-10-18 19:58:06 UTC
+"""
+
+import argparse
+import json
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from harness import REPO_ROOT, summarize
+
+HOOK_COMMAND = f"{shlex.quote(sys.executable)} -S {shlex.quote(str(REPO_ROOT / 'orchestrator' / 'hooks' / 'ping-pong.py'))}"
+
+TODOS = [
+    {"content": "Implement feature", "status": "in_progress", "activeForm": "Implementing feature"},
+    {"content": "Write docs", "status": "pending", "activeForm": "Writing docs"},
+    {"content": "Plan work", "status": "completed", "activeForm": "Planning work"}
+]
+
+
+def payloads(session_id: str, project_dir: str) -> dict[str, bytes]:
+    """Representative stdin payloads for the hot-path events."""
+    base = {"session_id": session_id, "cwd": project_dir, "transcript_path": "/dev/null"}
+    events = {
+        "PreToolUse": {**base, "hook_event_name": "PreToolUse", "tool_name": "Bash", "tool_input": {"command": "ls"}},
+        "PostToolUse": {**base, "hook_event_name": "PostToolUse", "tool_name": "Bash", "tool_input": {"command": "ls"}, "tool_response": {"stdout": "x" * 2048}},
+        "PreToolUse(TodoWrite)": {**base, "hook_event_name": "PreToolUse", "tool_name": "TodoWrite", "tool_input": {"todos": TODOS}},
+        "Stop": {**base, "hook_event_name": "Stop", "stop_hook_active": False}
+    }
+    return {name: json.dumps(payload).encode() for name, payload in events.items()}
+
+
+def time_command(command: str, stdin: bytes, env: dict[str, str], iterations: int) -> dict[str, float]:
+    """Run command iterations times and summarize latency in milliseconds."""
+    argv = shlex.split(command)
+    samples = []
+
+    for _ in range(iterations):
+        start = time.perf_counter()
+        subprocess.run(argv, input=stdin, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    return summarize(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--iterations', type=int, default=50, help="invocations per event (default: 50)")
+    parser.add_argument('--baseline', help="another hook command to time on the same payloads")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='hook-bench-') as scratch:
+        env = {k: v for k, v in os.environ.items() if k not in ('TMUX', 'TMUX_PANE', 'RESIN_AI_DEBUG')}
+        env.update(CLAUDE_PLUGIN_ROOT=scratch, HOME=scratch)
+        events = payloads('bench-session', str(Path(scratch) / 'project'))
+
+        results: dict[str, object] = {
+            "python_startup_floor": time_command(f"{shlex.quote(sys.executable)} -S -c pass", b'', env, args.iterations),
+            "hook": {name: time_command(HOOK_COMMAND, stdin, env, args.iterations) for name, stdin in events.items()}
+        }
+
+        if args.baseline:
+            results["baseline"] = {name: time_command(args.baseline, stdin, env, args.iterations) for name, stdin in events.items()}
+
+    json.dump(results, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Resources server benchmark on recorded read traces
+
+Each agent and command definition (orchestrator/agents/*.md, orchestrator/commands/*.md)
+instructs Claude to read a fixed sequence of plugin:orchestrator:resources:// files;
+that sequence, in document order, is one recorded session trace. Every trace is
+replayed as `read` tool calls:
+
+- in-process through MCPServer.handle_request on a fresh server per round
+  (cold: first pass, empty content cache) and again on the same server (warm)
+- over stdio against `resources.py` started the way the plugin launches it, one
+  request at a time for latency (cold and warm passes) and fully pipelined for
+  throughput
+
+"Cold" is server-cold (new server, on-disk bundle honoured, OS page cache warm).
+Pass --dump-traces DIR to write the traces as JSON-RPC .jsonl files that can be
+piped straight into the server. Results are printed as JSON (milliseconds,
+requests per second).
+
+Updated: 2026-10-18 19:58:06 UTC
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from harness import ORCHESTRATOR_DIR, load_server, server_command, summarize
+
+TRACE_SOURCES = ('agents', 'commands')
+REFERENCE_PATTERN = re.compile(r'plugin:orchestrator:resources://([\w./-]+\.md)')
+INITIALIZE = {"jsonrpc": "2.0", "id": 0, "method": "initialize", "params": {}}
+
+
+def record_traces() -> dict[str, list[str]]:
+    """Read sequences per agent/command definition, keyed as '<source>/<name>'."""
+    traces: dict[str, list[str]] = {}
+
+    for source in TRACE_SOURCES:
+        for path in sorted((ORCHESTRATOR_DIR / source).glob('*.md')):
+            uris = [f"plugin:orchestrator:resources://{match}" for match in REFERENCE_PATTERN.findall(path.read_text(encoding='utf-8'))]
+            if uris:
+                traces[f"{source}/{path.stem}"] = uris
+
+    return traces
+
+
+def read_requests(uris: list[str]) -> list[dict[str, Any]]:
+    """JSON-RPC `read` tool calls for a trace (ids start at 1; 0 is initialize)."""
+    return [
+        {"jsonrpc": "2.0", "id": number, "method": "tools/call", "params": {"name": "read", "arguments": {"file_path": uri}}}
+        for number, uri in enumerate(uris, start=1)
+    ]
+
+
+def dump_traces(traces: dict[str, list[str]], directory: Path) -> None:
+    """Write each trace as initialize + read calls, one JSON-RPC message per line."""
+    directory.mkdir(parents=True, exist_ok=True)
+    for name, uris in traces.items():
+        lines = [json.dumps(message) for message in [INITIALIZE, *read_requests(uris)]]
+        (directory / f"{name.replace('/', '-')}.jsonl").write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+
+def bench_in_process(traces: dict[str, list[str]], rounds: int) -> dict[str, object]:
+    """Replay every trace through handle_request: cold pass on a fresh server, then a warm pass."""
+    resources = load_server('resources', 'resources.py')
+
+    initialize: list[float] = []
+    cold: list[float] = []
+    warm: list[float] = []
+    errors = 0
+    per_trace: dict[str, dict[str, object]] = {}
+
+    for name, uris in traces.items():
+        requests = read_requests(uris)
+        trace_cold: list[float] = []
+        trace_warm: list[float] = []
+
+        for _ in range(rounds):
+            server = resources.MCPServer("benchmark")
+
+            start = time.perf_counter()
+            server.handle_request(dict(INITIALIZE))
+            initialize.append((time.perf_counter() - start) * 1000)
+
+            for samples in (trace_cold, trace_warm):
+                for request in requests:
+                    start = time.perf_counter()
+                    response = server.handle_request(request)
+                    samples.append((time.perf_counter() - start) * 1000)
+                    errors += "error" in response
+
+        cold.extend(trace_cold)
+        warm.extend(trace_warm)
+        per_trace[name] = {"reads": len(uris), "cold_p50_ms": summarize(trace_cold)["p50_ms"], "warm_p50_ms": summarize(trace_warm)["p50_ms"]}
+
+    return {
+        "initialize": summarize(initialize),
+        "cold_read": summarize(cold),
+        "warm_read": summarize(warm),
+        "cold_throughput_rps": round(len(cold) / (sum(cold) / 1000), 1) if cold else 0.0,
+        "warm_throughput_rps": round(len(warm) / (sum(warm) / 1000), 1) if warm else 0.0,
+        "errors": errors,
+        "traces": per_trace
+    }
+
+
+class StdioServer:
+    """resources.py over pipes, started as the plugin starts it."""
+
+    def __init__(self, env: dict[str, str]) -> None:
+        self.process = subprocess.Popen(server_command('resources.py'), cwd=ORCHESTRATOR_DIR, env=env, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        assert self.process.stdin is not None and self.process.stdout is not None
+        self.stdin = self.process.stdin
+        self.stdout = self.process.stdout
+
+    def call(self, request: dict[str, Any]) -> dict[str, Any]:
+        self.stdin.write(json.dumps(request).encode() + b'\n')
+        self.stdin.flush()
+        return json.loads(self.stdout.readline())
+
+    def pipelined(self, requests: list[dict[str, Any]]) -> float:
+        """Send all requests without waiting and return the seconds until the last response."""
+        payload = b''.join(json.dumps(request).encode() + b'\n' for request in requests)
+
+        def write() -> None:
+            self.stdin.write(payload)
+            self.stdin.flush()
+
+        start = time.perf_counter()
+        writer = threading.Thread(target=write)
+        writer.start()
+        for _ in requests:
+            self.stdout.readline()
+        elapsed = time.perf_counter() - start
+        writer.join()
+        return elapsed
+
+    def close(self) -> None:
+        self.stdin.close()
+        self.process.wait(timeout=10)
+
+
+def bench_stdio(traces: dict[str, list[str]], rounds: int) -> dict[str, object]:
+    """Replay every trace against a fresh stdio server per round."""
+    env = {k: v for k, v in os.environ.items() if k not in ('RESIN_AI_DEBUG', 'RESIN_AI_TRACE')}
+
+    startup: list[float] = []
+    cold: list[float] = []
+    warm: list[float] = []
+    pipelined_reads = 0
+    pipelined_seconds = 0.0
+    errors = 0
+
+    for uris in traces.values():
+        requests = read_requests(uris)
+
+        for _ in range(rounds):
+            start = time.perf_counter()
+            server = StdioServer(env)
+            server.call(INITIALIZE)
+            startup.append((time.perf_counter() - start) * 1000)
+
+            try:
+                for samples in (cold, warm):
+                    for request in requests:
+                        start = time.perf_counter()
+                        response = server.call(request)
+                        samples.append((time.perf_counter() - start) * 1000)
+                        errors += "error" in response
+
+                pipelined_seconds += server.pipelined(requests)
+                pipelined_reads += len(requests)
+            finally:
+                server.close()
+
+    return {
+        "startup": summarize(startup),
+        "cold_read": summarize(cold),
+        "warm_read": summarize(warm),
+        "pipelined_throughput_rps": round(pipelined_reads / pipelined_seconds, 1) if pipelined_seconds else 0.0,
+        "errors": errors
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--rounds', type=int, default=20, help="in-process rounds per trace (default: 20)")
+    parser.add_argument('--stdio-rounds', type=int, default=3, help="stdio server starts per trace, 0 to skip (default: 3)")
+    parser.add_argument('--trace', action='append', help="only replay this trace (e.g. agents/developer); repeatable")
+    parser.add_argument('--dump-traces', type=Path, metavar='DIR', help="write the traces as JSON-RPC .jsonl files and exit")
+    args = parser.parse_args()
+
+    traces = record_traces()
+    if args.trace:
+        unknown = sorted(set(args.trace) - set(traces))
+        if unknown:
+            parser.error(f"unknown trace(s): {', '.join(unknown)} (available: {', '.join(traces)})")
+        traces = {name: uris for name, uris in traces.items() if name in args.trace}
+
+    if args.dump_traces:
+        dump_traces(traces, args.dump_traces.resolve())
+        return
+
+    results: dict[str, object] = {
+        "traces": {name: len(uris) for name, uris in traces.items()},
+        "in_process": bench_in_process(traces, args.rounds)
+    }
+
+    if args.stdio_rounds > 0:
+        results["stdio"] = bench_stdio(traces, args.stdio_rounds)
+
+    json.dump(results, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
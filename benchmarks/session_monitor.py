@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Ping-pong session monitor benchmark on synthetic .sessions trees
+
+Generates a scratch CLAUDE_PLUGIN_ROOT per tree size (10 to 10,000 sessions by
+default, about 100 per project directory) laid out the way the hook writes it,
+and times the monitor's hot paths in-process:
+
+- discover_cold: SessionMonitor._discover_sessions on an empty table (every file parsed)
+- discover_warm: the same rescan with the table populated (stat only, nothing reparsed)
+- discover_changed: a rescan after rewriting 1% of the session files
+- check_stale: SessionMonitor._check_stale_sessions over the whole table as leader,
+  including its one tmux snapshot (tmux_snapshot is also reported on its own)
+
+Sessions are a mix of active, idle-without-todos and forgotten, so no check is
+due a nudge and the timings cover the scan and in-memory join rather than tmux
+round trips. tmux runs against a scratch TMUX_TMPDIR (no server), and server
+logging is limited to errors so terminal output does not dominate the timings.
+Results are printed as JSON (milliseconds).
+
+Updated: 2026-10-18 19:58:06 UTC
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from harness import load_server, summarize
+
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+SESSIONS_PER_PROJECT = 100
+
+TODOS_ACTIVE = [
+    {"content": "Implement feature", "status": "in_progress", "activeForm": "Implementing feature"},
+    {"content": "Write docs", "status": "pending", "activeForm": "Writing docs"}
+]
+TODOS_DONE = [
+    {"content": "Plan work", "status": "completed", "activeForm": "Planning work"}
+]
+
+
+def build_tree(plugin_root: Path, count: int) -> list[Path]:
+    """Write count session files under plugin_root/.sessions and return their paths.
+
+    7 in 10 sessions are active (fresh mtime, open todos), 2 are stale without
+    open todos and 1 is forgotten (older than the forget timeout).
+    """
+    now = time.time()
+    paths: list[Path] = []
+
+    for number in range(count):
+        project_dir = plugin_root / '.sessions' / f"users_dev_project_{number // SESSIONS_PER_PROJECT:04d}"
+        project_dir.mkdir(parents=True, exist_ok=True)
+
+        kind = number % 10
+        if kind < 7:
+            todos, mtime = TODOS_ACTIVE, now
+        elif kind < 9:
+            todos, mtime = TODOS_DONE, now - 300
+        else:
+            todos, mtime = TODOS_ACTIVE, now - 7200
+
+        path = project_dir / f"{number:08d}-0000-4000-8000-000000000000.json"
+        path.write_text(json.dumps(todos, separators=(',', ':')) + '\n')
+        os.utime(path, (mtime, mtime))
+        paths.append(path)
+
+    return paths
+
+
+def timed(function: Any, *args: Any) -> tuple[float, Any]:
+    """Call function(*args) and return (milliseconds, result)."""
+    start = time.perf_counter()
+    result = function(*args)
+    return (time.perf_counter() - start) * 1000, result
+
+
+def bench_tree(ping_pong: Any, plugin_root: Path, count: int, rounds: int) -> dict[str, object]:
+    """Time discovery and staleness checks on one generated tree."""
+    paths = build_tree(plugin_root, count)
+    os.environ['CLAUDE_PLUGIN_ROOT'] = str(plugin_root)
+
+    samples: dict[str, list[float]] = {name: [] for name in ("discover_cold", "discover_warm", "discover_changed", "tmux_snapshot", "check_stale")}
+    changed = paths[::100] or paths[:1]
+
+    for _ in range(rounds):
+        monitor = ping_pong.SessionMonitor()
+
+        elapsed, discovered = timed(monitor._discover_sessions)
+        samples["discover_cold"].append(elapsed)
+        monitor.sessions = discovered
+
+        elapsed, discovered = timed(monitor._discover_sessions)
+        samples["discover_warm"].append(elapsed)
+        monitor.sessions = discovered
+
+        for path in changed:
+            path.write_text(json.dumps(TODOS_ACTIVE + TODOS_DONE, separators=(',', ':')) + '\n')
+        elapsed, discovered = timed(monitor._discover_sessions)
+        samples["discover_changed"].append(elapsed)
+        monitor.sessions = discovered
+
+        # Staleness checks only run on the leader; take the (uncontended) lease on the scratch root
+        monitor.lease.start()
+        if not monitor.lease.acquired.wait(timeout=5):
+            raise RuntimeError(f"could not acquire the leader lease under {plugin_root}")
+
+        try:
+            samples["tmux_snapshot"].append(timed(monitor._tmux_snapshot)[0])
+            samples["check_stale"].append(timed(monitor._check_stale_sessions)[0])
+        finally:
+            monitor.lease.release()
+
+    return {
+        "sessions": len(monitor.sessions),
+        "projects": len({path.parent for path in paths}),
+        **{name: summarize(values) for name, values in samples.items()}
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help="sessions per tree (default: 10 100 1000 10000)")
+    parser.add_argument('--rounds', type=int, default=5, help="repetitions per tree (default: 5)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='sessions-bench-') as scratch:
+        os.environ['TMUX_TMPDIR'] = scratch
+        for name in ('TMUX', 'TMUX_PANE', 'RESIN_AI_DEBUG', 'RESIN_AI_TRACE'):
+            os.environ.pop(name, None)
+
+        ping_pong = load_server('ping_pong', 'ping-pong.py')
+        logging.getLogger('ping-pong').setLevel(logging.ERROR)
+
+        results = {str(count): bench_tree(ping_pong, Path(scratch) / f"root-{count}", count, args.rounds) for count in args.sizes}
+
+    json.dump(results, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
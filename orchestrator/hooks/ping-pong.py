@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Ping-pong hook - tracks active sessions via file presence
+
+Creates session file ONLY on active work events, deletes on SessionEnd.
+File existence = session is actively working (not just open).
+Renames tmux session to match Claude Code session ID.
+Session file format: JSON array of todos from TodoWrite.
+
+Runs on every tool call, so it parses stdin once, forks nothing on the hot
+path (PreToolUse/PostToolUse) and writes the session file atomically. When a
+leader monitor is listening on .sessions/monitor.sock, the event is also
+pushed to it as a datagram so it sees activity without touching the disk.
+Uses only Python standard library; run with `python3 -S` to skip site setup.
+Modules only needed off the hot path (subprocess, random) are imported lazily
+and pathlib/tempfile are avoided to keep interpreter startup minimal.
+
+Enable debug logging by setting RESIN_AI_DEBUG=1.
+
+Updated: 2026-10-18 17:44:51 UTC
+"""
+
+import json
+import os
+import sys
+import time
+
+# ONLY these events create/update the session file
+ACTIVE_EVENTS = ("UserPromptSubmit", "PreToolUse", "PostToolUse")
+
+# Events that ALWAYS indicate work completion (delete session file unconditionally)
+FINAL_EVENTS = ("SubagentStop",)
+
+# Events that check for todos before deleting (todo-aware cleanup)
+TODO_AWARE_EVENTS = ("SessionEnd", "Stop")
+
+# All other events are passive - they don't create/update session files
+# This means a session that's just open but not doing work won't be tracked
+
+CONTINUATION_MESSAGES = (
+    "Please continue working...",
+    "Continue with the next tasks...",
+    "Let's keep going...",
+    "Please proceed...",
+    "Continue..."
+)
+
+DEBUG = os.environ.get('RESIN_AI_DEBUG') == '1'
+
+
+def normalize_project_dir(project_dir: str) -> str:
+    """Normalize project folder name to safe directory name.
+
+    Example: /Users/dev/My Project -> users_dev_my_project
+    """
+    return project_dir.lower().removeprefix('/').replace('/', '_').replace(' ', '_')
+
+
+def has_active_todos(todos: object) -> bool:
+    """True if any todo is in_progress or pending."""
+    return isinstance(todos, list) and any(isinstance(t, dict) and t.get('status') in ('in_progress', 'pending') for t in todos)
+
+
+class Hook:
+    """One hook invocation: parsed stdin plus the derived session paths."""
+
+    def __init__(self, payload: dict[str, object]) -> None:
+        self.payload = payload
+        self.session_id = str(payload.get('session_id') or '')
+        self.event_name = str(payload.get('hook_event_name') or os.environ.get('hook_event_name') or 'unknown')
+        self.tool_name = str(payload.get('tool_name') or '')
+        self.project_dir = str(payload.get('cwd') or os.environ.get('CLAUDE_PROJECT_DIR') or '.')
+
+        # Use CLAUDE_PLUGIN_ROOT for .sessions storage (system-wide)
+        plugin_root = os.environ.get('CLAUDE_PLUGIN_ROOT', '.')
+        self.normalized_dir = normalize_project_dir(self.project_dir)
+        self.session_dir = os.path.join(plugin_root, '.sessions', self.normalized_dir)
+        self.monitor_socket = os.path.join(plugin_root, '.sessions', 'monitor.sock')
+        self.session_file = os.path.join(self.session_dir, f"{self.session_id}.json")
+        self.log_file = os.path.join(self.session_dir, 'logs', f"{self.session_id}.log")
+        self._log_lines: list[str] = []
+
+        self.todos_text = self._load_todos()
+
+    def log_debug(self, message: str) -> None:
+        if DEBUG:
+            self._log_lines.append(message)
+
+    def flush_log(self) -> None:
+        """Append buffered debug lines to the session log in one write."""
+        if self._log_lines:
+            os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
+            with open(self.log_file, 'a') as log:
+                log.write('\n'.join(self._log_lines) + '\n')
+
+    def _load_todos(self) -> str:
+        """Todos as JSON text: tool_input.todos, then .todos, then ~/.claude/todos fallback."""
+        tool_input = self.payload.get('tool_input')
+        todos = tool_input.get('todos') if isinstance(tool_input, dict) else None
+        if todos is None:
+            todos = self.payload.get('todos')
+
+        if todos is not None:
+            self.log_debug(f"Loaded todos from stdin: {len(todos) if isinstance(todos, list) else 0} todos")
+            return json.dumps(todos, separators=(',', ':'), ensure_ascii=False)
+
+        # If todos not in stdin, try to read from ~/.claude/todos as fallback
+        todo_file = os.path.join(os.path.expanduser('~'), '.claude', 'todos', f"{self.session_id}-agent-{self.session_id}.json")
+        try:
+            with open(todo_file) as handle:
+                todos_text = handle.read()
+        except OSError:
+            self.log_debug("No todos found in stdin or file, using empty array")
+            return '[]'
+
+        self.log_debug(f"Loaded todos from file: {todo_file}")
+        return todos_text.strip()
+
+    def todos(self) -> object:
+        try:
+            return json.loads(self.todos_text)
+        except json.JSONDecodeError:
+            return None
+
+    def write_session_file(self) -> bool:
+        """Write the todos to the session file atomically (temp file + rename).
+
+        Back-to-back events usually carry identical todos; then only the mtime is
+        refreshed (os.utime) and False is returned.
+        """
+        content = self.todos_text + '\n'
+
+        try:
+            with open(self.session_file) as current:
+                if current.read() == content:
+                    os.utime(self.session_file)
+                    return False
+        except OSError:
+            pass
+
+        os.makedirs(self.session_dir, exist_ok=True)
+
+        # Dot-prefixed temp name: not *.json, so the monitor never picks it up
+        temp_path = os.path.join(self.session_dir, f".{self.session_id}.{os.getpid()}.tmp")
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            with os.fdopen(fd, 'w') as temp_file:
+                temp_file.write(content)
+            os.replace(temp_path, self.session_file)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+        return True
+
+    def remove_session_file(self) -> bool:
+        try:
+            os.unlink(self.session_file)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def notify_monitor(self, removed: bool = False) -> None:
+        """Push this event to the leader monitor over its datagram socket (best effort).
+
+        The session file is already written or removed at this point and stays
+        the durable record, so a missing or busy monitor is simply ignored.
+        """
+        if not self.session_id or not os.path.exists(self.monitor_socket):
+            return
+
+        import socket
+
+        todos = self.todos()
+        message = json.dumps({
+            "session_id": self.session_id,
+            "event": self.event_name,
+            "ts": time.time(),
+            "active_todo_count": sum(1 for t in todos if isinstance(t, dict) and t.get('status') in ('in_progress', 'pending')) if isinstance(todos, list) else 0,
+            "project": self.normalized_dir,
+            "removed": removed
+        }, separators=(',', ':')).encode()
+
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+                sock.setblocking(False)
+                sock.sendto(message, self.monitor_socket)
+        except OSError as e:
+            # No leader listening, or its queue is full
+            self.log_debug(f"Monitor push skipped: {e}")
+
+    def rename_tmux_session(self) -> None:
+        """Rename the tmux session containing this pane to the Claude Code session ID."""
+        tmux_pane = os.environ.get('TMUX_PANE')
+        if not tmux_pane or not self.session_id:
+            return
+
+        import subprocess
+
+        try:
+            result = subprocess.run(['tmux', 'rename-session', '-t', tmux_pane, self.session_id], capture_output=True, timeout=2)
+        except (OSError, subprocess.SubprocessError):
+            return
+
+        if result.returncode == 0:
+            self.log_debug(f"Renamed tmux session to '{self.session_id}'")
+        else:
+            self.log_debug("Failed to rename tmux session (may already be named correctly)")
+
+    def send_continuation(self) -> None:
+        """Type a continuation prompt into this session's tmux session."""
+        import random
+        import subprocess
+
+        message = random.choice(CONTINUATION_MESSAGES)
+
+        # Send message and Enter as separate commands with small delay
+        # Target the tmux session by SESSION_ID (we renamed session to match)
+        try:
+            subprocess.run(['tmux', 'send-keys', '-t', self.session_id, message], capture_output=True, timeout=2)
+            time.sleep(0.1)
+            subprocess.run(['tmux', 'send-keys', '-t', self.session_id, 'Enter'], capture_output=True, timeout=2)
+        except (OSError, subprocess.SubprocessError):
+            return
+
+        self.log_debug(f"Sent continuation to tmux session {self.session_id}: {message}")
+
+    def log_header(self, raw_input: str) -> None:
+        """Log timestamp, event, CLAUDE_ environment and the full stdin JSON."""
+        if not DEBUG:
+            return
+
+        self.log_debug("========================================")
+        self.log_debug(f"Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime())}")
+        self.log_debug(f"Event: {self.event_name}")
+        self.log_debug(f"Tool: {self.tool_name}")
+        self.log_debug(f"Session ID: {self.session_id}")
+        self.log_debug(f"Working Dir: {self.project_dir}")
+        self.log_debug("")
+        self.log_debug("CLAUDE_ Environment Variables:")
+        for key in sorted(k for k in os.environ if k.startswith('CLAUDE_')):
+            self.log_debug(f"{key}={os.environ[key]}")
+        self.log_debug("")
+        self.log_debug("Stdin Input (Full JSON):")
+        self.log_debug(json.dumps(self.payload, indent=2, ensure_ascii=False) if self.payload else raw_input)
+        self.log_debug("")
+
+    def run(self) -> None:
+        # Rename tmux session to match Claude Code session ID on SessionStart and UserPromptSubmit
+        if self.event_name in ("SessionStart", "UserPromptSubmit"):
+            self.rename_tmux_session()
+
+        # Handle FINAL completion events - always delete session file
+        if self.event_name in FINAL_EVENTS:
+            removed = self.remove_session_file()
+            self.log_debug(f"Final event: {self.event_name} - {'removed session file' if removed else 'no session file to remove'}")
+            if removed:
+                self.notify_monitor(removed=True)
+            return
+
+        # Handle todo-aware events - only delete session file if no active/pending todos
+        if self.event_name in TODO_AWARE_EVENTS:
+            self.log_debug(f"{self.event_name} event: checking for active todos")
+            if has_active_todos(self.todos()):
+                self.log_debug(f"{self.event_name} event: has active/pending todos - keeping session file")
+                return
+
+            removed = self.remove_session_file()
+            self.log_debug(f"{self.event_name} event: {'removed session file' if removed else 'no session file to remove'}")
+            if removed:
+                self.notify_monitor(removed=True)
+            return
+
+        # Handle Notification events - check for idle_prompt
+        if self.event_name == "Notification":
+            notification_type = self.payload.get('notification_type')
+            self.log_debug(f"Notification event: type={notification_type}")
+
+            if notification_type == "idle_prompt" and self.session_id:
+                if has_active_todos(self.todos()):
+                    self.log_debug("Idle prompt: Found active todos - sending continuation prompt")
+                    self.send_continuation()
+                else:
+                    self.log_debug("Idle prompt: No active todos found")
+
+            # Notifications are passive - don't update session file
+            return
+
+        # Only create/update session file for active work events
+        if self.event_name in ACTIVE_EVENTS and self.session_id:
+            written = self.write_session_file()
+            self.log_debug(f"Activity: {self.event_name} ({'wrote session file' if written else 'todos unchanged, touched session file'})")
+            self.notify_monitor()
+        else:
+            self.log_debug(f"Event: {self.event_name} (passive - no session file update)")
+
+
+def main() -> None:
+    raw_input = sys.stdin.read()
+
+    # Parse session info from stdin JSON
+    try:
+        payload = json.loads(raw_input) if raw_input.strip() else {}
+    except json.JSONDecodeError:
+        payload = {}
+    if not isinstance(payload, dict):
+        payload = {}
+
+    hook = Hook(payload)
+    hook.log_header(raw_input)
+
+    try:
+        hook.run()
+    finally:
+        hook.flush_log()
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        # A hook must never block the session
+        print(f"ping-pong hook error: {e}", file=sys.stderr)
+    sys.exit(0)
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Runtime metrics for the orchestrator MCP servers
+
+Zero-dependency counters, gauges and latency histograms shared by resources.py
+and ping-pong.py, reported through each server's `stats` tool.
+
+- Updates are a dict lookup and an add under one lock; histograms use fixed
+  buckets (bisect), so recording never allocates per sample
+- Gauges that are cheap to read on demand (cache size, leader status) are
+  filled in by collectors only when a snapshot is taken
+- RESIN_AI_METRICS_INTERVAL=<seconds> also writes the metrics every interval in
+  Prometheus text format to .sessions/<server>-<pid>.prom (atomic rename), for
+  node_exporter's textfile collector; the file is removed when the server exits
+
+Requires Python 3.10+
+
+Updated: 2026-10-18 20:41:13 UTC
+"""
+
+import bisect
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# Upper bounds (milliseconds) of the latency histogram buckets; the last bucket is +Inf
+LATENCY_BUCKETS_MS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 1000.0, 5000.0)
+
+# Prometheus `le` labels for those buckets (exported in seconds), followed by +Inf
+BUCKET_LABELS = tuple(f'le="{bound / 1000:g}"' for bound in LATENCY_BUCKETS_MS) + ('le="+Inf"',)
+
+
+def export_interval() -> float:
+    """Textfile export interval from RESIN_AI_METRICS_INTERVAL (0 = disabled)."""
+    try:
+        return max(0.0, float(os.environ.get('RESIN_AI_METRICS_INTERVAL', '0')))
+    except ValueError:
+        return 0.0
+
+
+def textfile_path(server: str) -> Path:
+    """Per-process Prometheus textfile under the system-wide .sessions directory."""
+    return Path(os.environ.get('CLAUDE_PLUGIN_ROOT') or '.') / '.sessions' / f"{server}-{os.getpid()}.prom"
+
+
+def sample_value(value: float) -> str:
+    """Exposition-format number: integers exactly, floats at full precision."""
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (milliseconds)."""
+
+    __slots__ = ('counts', 'count', 'total')
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def quantile(self, q: float) -> float | None:
+        """Upper bound of the bucket holding the q-quantile (None = above the largest bucket)."""
+        rank = q * self.count
+        cumulative = 0
+        for bound, bucket_count in zip(LATENCY_BUCKETS_MS, self.counts):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                return bound
+        return None
+
+    def snapshot(self) -> dict[str, Any]:
+        """Count, sum, mean, bucket-bound p50/p99 and the non-empty buckets (keyed by upper bound)."""
+        bounds = [f"le_{bound:g}" for bound in LATENCY_BUCKETS_MS] + ["le_inf"]
+        return {
+            "count": self.count,
+            "sum_ms": round(self.total, 3),
+            "mean_ms": round(self.total / self.count, 3) if self.count else 0.0,
+            "p50_le_ms": self.quantile(0.5) if self.count else 0.0,
+            "p99_le_ms": self.quantile(0.99) if self.count else 0.0,
+            "buckets": {bound: bucket_count for bound, bucket_count in zip(bounds, self.counts) if bucket_count}
+        }
+
+
+class Metrics:
+    """Counters, gauges and histograms, each keyed by metric name and an optional label value.
+
+    labels maps a metric name to its Prometheus label key (e.g. "requests_total"
+    -> "method"); metrics without an entry are unlabelled. Histogram names end
+    in "_ms" and are exported as "_seconds".
+    """
+
+    def __init__(self, prefix: str, labels: dict[str, str] | None = None) -> None:
+        self.prefix = prefix
+        self.labels = labels or {}
+        self.started = time.time()
+        self.counters: dict[str, dict[str, float]] = {}
+        self.gauges: dict[str, dict[str, float]] = {}
+        self.histograms: dict[str, dict[str, Histogram]] = {}
+        self.collectors: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, label: str = '', amount: float = 1) -> None:
+        with self._lock:
+            series = self.counters.setdefault(name, {})
+            series[label] = series.get(label, 0) + amount
+
+    def count(self, name: str, total: float, label: str = '') -> None:
+        """Set a counter whose running total is kept elsewhere (e.g. a cache's own hit count)."""
+        with self._lock:
+            self.counters.setdefault(name, {})[label] = total
+
+    def set(self, name: str, value: float, label: str = '') -> None:
+        with self._lock:
+            self.gauges.setdefault(name, {})[label] = value
+
+    def observe(self, name: str, value_ms: float, label: str = '') -> None:
+        with self._lock:
+            series = self.histograms.setdefault(name, {})
+            histogram = series.get(label)
+            if histogram is None:
+                histogram = series[label] = Histogram()
+            histogram.observe(value_ms)
+
+    def collector(self, collect: Callable[[], None]) -> None:
+        """Register a callable that refreshes gauges right before each snapshot or export."""
+        self.collectors.append(collect)
+
+    def collect(self) -> None:
+        for collect in self.collectors:
+            collect()
+
+    def top(self, name: str, limit: int) -> list[tuple[str, float]]:
+        """Largest label values of a counter, highest first."""
+        with self._lock:
+            series = list(self.counters.get(name, {}).items())
+        return sorted(series, key=lambda item: (-item[1], item[0]))[:limit]
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-friendly view: unlabelled series as plain values, labelled ones as {label: value}."""
+        self.collect()
+
+        def flatten(series: dict[str, Any], render: Callable[[Any], Any]) -> Any:
+            if set(series) == {''}:
+                return render(series[''])
+            return {label: render(value) for label, value in sorted(series.items())}
+
+        with self._lock:
+            return {
+                "uptime_seconds": round(time.time() - self.started, 1),
+                "counters": {name: flatten(series, lambda value: value) for name, series in sorted(self.counters.items())},
+                "gauges": {name: flatten(series, lambda value: value) for name, series in sorted(self.gauges.items())},
+                "histograms": {name: flatten(series, Histogram.snapshot) for name, series in sorted(self.histograms.items())}
+            }
+
+    def prometheus(self) -> str:
+        """Render every series in the Prometheus text exposition format (pid as a constant label)."""
+        self.collect()
+        pid = os.getpid()
+        lines: list[str] = []
+
+        def labels(name: str, label: str, extra: str = '') -> str:
+            pairs = [f'pid="{pid}"']
+            if name in self.labels and label:
+                escaped = label.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+                pairs.append(f'{self.labels[name]}="{escaped}"')
+            if extra:
+                pairs.append(extra)
+            return '{' + ','.join(pairs) + '}'
+
+        with self._lock:
+            lines.append(f"# TYPE {self.prefix}_uptime_seconds gauge")
+            lines.append(f"{self.prefix}_uptime_seconds{labels('', '')} {time.time() - self.started:.1f}")
+
+            for kind, table in (("counter", self.counters), ("gauge", self.gauges)):
+                for name, series in sorted(table.items()):
+                    lines.append(f"# TYPE {self.prefix}_{name} {kind}")
+                    for label, value in sorted(series.items()):
+                        lines.append(f"{self.prefix}_{name}{labels(name, label)} {sample_value(value)}")
+
+            for name, histograms in sorted(self.histograms.items()):
+                metric = f"{self.prefix}_{name.removesuffix('_ms')}_seconds"
+                lines.append(f"# TYPE {metric} histogram")
+                for label, histogram in sorted(histograms.items()):
+                    cumulative = 0
+                    for bound, bucket_count in zip(BUCKET_LABELS, histogram.counts):
+                        cumulative += bucket_count
+                        lines.append(f"{metric}_bucket{labels(name, label, bound)} {cumulative}")
+                    lines.append(f"{metric}_sum{labels(name, label)} {sample_value(histogram.total / 1000)}")
+                    lines.append(f"{metric}_count{labels(name, label)} {histogram.count}")
+
+        return '\n'.join(lines) + '\n'
+
+
+class TextfileExporter:
+    """Background writer of Metrics.prometheus() to a textfile every interval seconds."""
+
+    def __init__(self, metrics: Metrics, path: Path, interval: float) -> None:
+        self.metrics = metrics
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True, name="metrics-textfile")
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.write()
+
+    def write(self) -> None:
+        """Write the textfile atomically (node_exporter never sees a partial file)."""
+        # Dot-prefixed temp name: not *.prom, so the collector ignores it
+        temp_path = self.path.with_name(f".{self.path.name}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text(self.metrics.prometheus(), encoding='utf-8')
+            os.replace(temp_path, self.path)
+        except OSError:
+            pass
+
+    def stop(self) -> None:
+        """Stop exporting and remove the textfile so a dead process leaves no stale series."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+
+
+def start_exporter(metrics: Metrics, server: str) -> TextfileExporter | None:
+    """Start the textfile exporter if RESIN_AI_METRICS_INTERVAL is set."""
+    interval = export_interval()
+    if not interval:
+        return None
+
+    exporter = TextfileExporter(metrics, textfile_path(server), interval)
+    exporter.start()
+    return exporter
@@ -9,10 +9,23 @@ Uses only Python standard library - no external dependencies required.
 Implements MCP (Model Context Protocol) JSON-RPC 2.0 over stdio.
 
 Features:
-- Hook-based session tracking (ping-pong.sh creates/deletes session files on active events)
+- Hook-based session tracking (hooks/ping-pong.py creates/deletes session files on active events)
 - File existence-based activity monitoring (file only exists when active work is happening)
 - File mtime-based staleness detection (no polling overhead)
 - Auto-discovery of sessions from $CLAUDE_PLUGIN_ROOT/.sessions/
+- Event-driven session table updates via inotify (mtime-diff rescans where unavailable)
+- flock()-based leader lease: one monitor per host, instant failover when it exits
+- Single tmux control-mode client (tmux -C) for all probes and nudges, with subprocess fallback
+- Weighted liveness from file mtime, explicit heartbeats and tmux window activity (RESIN_AI_LIVENESS_WEIGHTS)
+- Deadline scheduling: the monitor sleeps until the next stale/forget crossing or a file event
+- Hook push channel: Unix datagram socket at .sessions/monitor.sock (files remain the fallback)
+- Level-gated lazy logging with an optional error-triggered trace buffer (tracing.py)
+- Shared stdio framing with resources.py: encode-once binary writes, bounded line reads (transport.py)
+- `stats` tool: tick durations, scan counts, parse failures, nudges and leader status (metrics.py),
+  optionally exported as a Prometheus textfile under .sessions/ (RESIN_AI_METRICS_INTERVAL)
+- Session tools: register_session, heartbeat, mark_stale and list_sessions; explicit
+  registrations and heartbeats are merged with file-discovered state in the leader's
+  session table (followers forward them over the push channel)
 - Direct tmux session continuation prompt injection
 - Zero external dependencies
 
@@ -26,43 +39,648 @@ Activity tracking:
 
 Requires Python 3.10+
 
-Updated: 2025-11-11 17:59:24 UTC
+Updated: 2026-10-18 22:11:58 UTC
 """
 
+import ctypes
+import ctypes.util
+import heapq
 import json
 import logging
 import os
 import random
+import select
+import socket
+import struct
 import subprocess
 import sys
 import threading
 import time
+from collections import deque
 from pathlib import Path
 from typing import Any, Union
 
+import metrics
+import tracing
+import transport
+
 # Type alias for JSON-compatible values (Python 3.10+ compatible)
 JsonValue = Union[str, int, float, bool, None, dict[str, "JsonValue"], list["JsonValue"]]
 
-# Setup logging to stderr
-# Use INFO level by default (set RESIN_AI_DEBUG=1 for DEBUG level)
-log_level = logging.DEBUG if os.environ.get('RESIN_AI_DEBUG') == '1' else logging.INFO
-logging.basicConfig(
-    level=log_level,
-    format='[%(levelname)s] %(message)s',
-    stream=sys.stderr
-)
-logger = logging.getLogger(__name__)
+# Setup logging to stderr (RESIN_AI_DEBUG=1 for DEBUG level, RESIN_AI_TRACE=N for an error-triggered ring buffer)
+logger = tracing.get_logger('ping-pong')
+
+
+def parse_liveness_weights(value: str | None) -> dict[str, float]:
+    """Parse RESIN_AI_LIVENESS_WEIGHTS ("file=1,heartbeat=1,tmux=0.5") over the default weights."""
+    weights = {"file": 1.0, "heartbeat": 1.0, "tmux": 1.0}
+
+    for item in (value or '').split(','):
+        name, _, weight = item.partition('=')
+        name = name.strip()
+        if name in weights:
+            try:
+                weights[name] = max(0.0, float(weight))
+            except ValueError:
+                logger.warning("Ignoring invalid liveness weight: %r", item)
+
+    return weights
+
+# inotify(7) event masks
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+INOTIFY_EVENT = struct.Struct('iIII')  # wd, mask, cookie, len (followed by name)
+
+# .sessions/ itself: project directories appearing or disappearing
+SESSIONS_ROOT_MASK = IN_CREATE | IN_MOVED_TO | IN_DELETE | IN_MOVED_FROM | IN_DELETE_SELF | IN_ONLYDIR
+# .sessions/<project>/: finished writes, touches, renames and deletes of session files
+# (IN_CREATE is left out on purpose - the file is still empty at that point)
+SESSIONS_PROJECT_MASK = IN_CLOSE_WRITE | IN_ATTRIB | IN_MOVED_TO | IN_MOVED_FROM | IN_DELETE | IN_ONLYDIR
+
+
+def get_sessions_root() -> Path:
+    """Return the system-wide .sessions directory (under CLAUDE_PLUGIN_ROOT)."""
+    # Use CLAUDE_PLUGIN_ROOT for .sessions storage (system-wide)
+    plugin_root = os.environ.get('CLAUDE_PLUGIN_ROOT')
+
+    if plugin_root:
+        plugin_dir = Path(plugin_root)
+    else:
+        plugin_dir = Path('.')
+
+    return plugin_dir / '.sessions'
+
+
+class SessionWatcher:
+    """Event-driven change detection for .sessions/ using inotify (Linux), via ctypes.
+
+    wait() blocks until session files change or the timeout expires and returns
+    the set of changed paths (session files, or project directories that must be
+    rescanned as a whole). It returns None when the caller has to fall back to a
+    full mtime-diff rescan: inotify is unavailable (e.g. macOS), the sessions
+    root does not exist yet, or the kernel event queue overflowed.
+    """
+
+    def __init__(self, sessions_root: Path, poll_interval: float) -> None:
+        self.sessions_root = sessions_root
+        self.poll_interval = poll_interval
+        self.fd: int | None = None
+        self.watches: dict[int, Path] = {}
+        self.ready = False
+        self._libc: ctypes.CDLL | None = None
+
+        # Other descriptors that should end wait() when readable (e.g. the push channel)
+        self.readers: list[int] = []
+
+        # Self-pipe so other threads can interrupt wait()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+
+        if sys.platform.startswith('linux'):
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+                fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            except (OSError, AttributeError) as e:
+                logger.debug("inotify unavailable: %s", e)
+            else:
+                if fd >= 0:
+                    self._libc = libc
+                    self.fd = fd
+                else:
+                    logger.debug("inotify_init1 failed: errno=%s", ctypes.get_errno())
+
+        if self.fd is not None:
+            self.ready = self._watch_tree()
+
+        logger.debug("Session watcher: %s on %s", 'inotify' if self.fd is not None else 'polling', sessions_root)
+
+    def close(self) -> None:
+        """Release the inotify descriptor and the wake pipe."""
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+        os.close(self._wake_r)
+        os.close(self._wake_w)
+
+    def wake(self) -> None:
+        """Interrupt a blocked wait() from another thread."""
+        try:
+            os.write(self._wake_w, b'\0')
+        except (BlockingIOError, OSError):
+            pass
+
+    def _drain_wake(self) -> None:
+        try:
+            while os.read(self._wake_r, 4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def _sleep(self, timeout: float) -> bool:
+        """Sleep until the timeout, a wake() or a readable reader; True if woken."""
+        readable, _, _ = select.select([self._wake_r, *self.readers], [], [], timeout)
+        if self._wake_r in readable:
+            self._drain_wake()
+        return bool(readable)
+
+    def _add_watch(self, path: Path, mask: int) -> bool:
+        assert self._libc is not None and self.fd is not None
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            logger.debug("inotify_add_watch failed for %s: errno=%s", path, ctypes.get_errno())
+            return False
+
+        self.watches[wd] = path
+        return True
+
+    def _watch_tree(self) -> bool:
+        """Watch the sessions root and every project directory below it."""
+        self.watches = {}
+
+        if not self._add_watch(self.sessions_root, SESSIONS_ROOT_MASK):
+            return False
+
+        try:
+            for entry in os.scandir(self.sessions_root):
+                if entry.is_dir():
+                    self._add_watch(Path(entry.path), SESSIONS_PROJECT_MASK)
+        except OSError:
+            return False
+
+        return True
+
+    def wait(self, timeout: float | None) -> set[Path] | None:
+        """Block up to timeout seconds (None = until something happens) and return changed paths.
+
+        Returns None when everything must be rescanned. Without inotify that is
+        at least every poll_interval; an empty set means a timeout or wake().
+        """
+        if self.fd is None or not self.ready:
+            if self.fd is not None:
+                self.ready = self._watch_tree()
+                if self.ready:
+                    # Anything may have changed before the watches existed
+                    return None
+
+            # Polling (no inotify, or sessions root not created yet)
+            poll = self.poll_interval if timeout is None else min(timeout, self.poll_interval)
+            return set() if self._sleep(poll) else None
+
+        readable, _, _ = select.select([self.fd, self._wake_r, *self.readers], [], [], timeout)
+        if self._wake_r in readable:
+            self._drain_wake()
+        if self.fd not in readable:
+            return set()
+
+        return self._read_events()
+
+    def _read_events(self) -> set[Path] | None:
+        """Drain pending inotify events into a set of changed paths."""
+        assert self.fd is not None
+        changed: set[Path] = set()
+
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return changed
+
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = INOTIFY_EVENT.unpack_from(data, offset)
+                name = os.fsdecode(data[offset + INOTIFY_EVENT.size:offset + INOTIFY_EVENT.size + length].rstrip(b'\0'))
+                offset += INOTIFY_EVENT.size + length
+
+                if mask & IN_Q_OVERFLOW:
+                    logger.warning("inotify queue overflow - falling back to full rescan")
+                    self.ready = False
+                    return None
+
+                if mask & IN_IGNORED:
+                    self.watches.pop(wd, None)
+                    continue
+
+                directory = self.watches.get(wd)
+                if directory is None:
+                    continue
+
+                if directory == self.sessions_root:
+                    if mask & IN_DELETE_SELF:
+                        self.ready = False
+                        return None
+
+                    if mask & IN_ISDIR and name:
+                        project_dir = directory / name
+                        if mask & (IN_CREATE | IN_MOVED_TO):
+                            self._add_watch(project_dir, SESSIONS_PROJECT_MASK)
+                        changed.add(project_dir)
+                    continue
+
+                if name.endswith('.json'):
+                    changed.add(directory / name)
+
+
+
+class PushChannel:
+    """Unix datagram socket (.sessions/monitor.sock) where hooks push session activity.
+
+    Only the leader binds it. Each datagram is a small JSON object
+    {session_id, event, ts, active_todo_count, project, removed}. The session
+    files stay authoritative; this channel only makes updates visible
+    immediately instead of after the next filesystem event or rescan.
+    Followers also forward the register/heartbeat tool calls they receive
+    here (event "register" or "heartbeat", plus tmux_session/session_type).
+    """
+
+    MAX_DATAGRAM = 4096
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.sock: socket.socket | None = None
+
+    def open(self) -> bool:
+        """Bind the socket (the caller holds the leader lease, so any existing file is stale)."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            sock.bind(str(self.path))
+            sock.setblocking(False)
+        except OSError as e:
+            logger.warning("Push channel unavailable at %s: %s", self.path, e)
+            return False
+
+        self.sock = sock
+        logger.debug("Push channel listening on %s", self.path)
+        return True
+
+    def fileno(self) -> int:
+        assert self.sock is not None
+        return self.sock.fileno()
+
+    def drain(self) -> list[dict[str, Any]]:
+        """Read every pending datagram, skipping malformed ones."""
+        messages: list[dict[str, Any]] = []
+        if self.sock is None:
+            return messages
+
+        while True:
+            try:
+                data = self.sock.recv(self.MAX_DATAGRAM)
+            except BlockingIOError:
+                return messages
+            except OSError as e:
+                logger.debug("Push channel receive failed: %s", e)
+                return messages
+
+            try:
+                message = json.loads(data)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                logger.debug("Ignoring malformed push message: %r", data[:100])
+                continue
+
+            if isinstance(message, dict) and isinstance(message.get('session_id'), str) and message['session_id']:
+                messages.append(message)
+
+    def close(self) -> None:
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+
+
+class DeadlineScheduler:
+    """Min-heap of per-session deadlines with lazy invalidation.
+
+    Rescheduling a key pushes a new heap entry; entries that no longer match
+    the key's current deadline are skipped when popped.
+    """
+
+    def __init__(self) -> None:
+        self.heap: list[tuple[float, str]] = []
+        self.deadlines: dict[str, float] = {}
+
+    def schedule(self, key: str, deadline: float | None) -> None:
+        """Set (or clear, with None) the deadline for key."""
+        if deadline is None:
+            self.deadlines.pop(key, None)
+            return
+
+        self.deadlines[key] = deadline
+        heapq.heappush(self.heap, (deadline, key))
+
+    def next_deadline(self) -> float | None:
+        """Earliest pending deadline, or None if nothing is scheduled."""
+        while self.heap and self.deadlines.get(self.heap[0][1]) != self.heap[0][0]:
+            heapq.heappop(self.heap)
+        return self.heap[0][0] if self.heap else None
+
+    def pop_due(self, now: float) -> list[str]:
+        """Remove and return every key whose deadline has passed."""
+        due = []
+        while (deadline := self.next_deadline()) is not None and deadline <= now:
+            _, key = heapq.heappop(self.heap)
+            del self.deadlines[key]
+            due.append(key)
+        return due
+
+    def __len__(self) -> int:
+        return len(self.deadlines)
+
+
+class LeaderLease:
+    """Leader election via an exclusive flock() on .sessions/.leader.lock.
+
+    The kernel releases the lock when its holder exits (including SIGKILL), so a
+    follower blocked in flock() takes over immediately. Followers sleep on the
+    lock in a background thread - no polling and no subprocesses. The lease file
+    records the holder's PID for diagnostics only.
+    """
+
+    def __init__(self, lock_path: Path) -> None:
+        self.lock_path = lock_path
+        self.acquired = threading.Event()
+        self._fd: int | None = None
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start competing for the lease (returns immediately)."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._acquire, daemon=True, name="leader-lease")
+            self._thread.start()
+
+    def _acquire(self) -> None:
+        try:
+            import fcntl
+        except ImportError:
+            logger.warning("fcntl not available, assuming leader")
+            self.acquired.set()
+            return
+
+        try:
+            self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT | os.O_CLOEXEC, 0o644)
+        except OSError as e:
+            logger.warning("Cannot open leader lease %s: %s, assuming leader", self.lock_path, e)
+            self.acquired.set()
+            return
+
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            logger.info("✗ FOLLOWER monitor (PID %s, leader: %s)", os.getpid(), self.holder())
+            # Sleep on the lock until the current leader exits
+            fcntl.flock(fd, fcntl.LOCK_EX)
+
+        self._fd = fd
+        os.ftruncate(fd, 0)
+        os.pwrite(fd, f"{os.getpid()}\n".encode(), 0)
+
+        logger.info("✓ LEADER monitor elected (PID %s)", os.getpid())
+        self.acquired.set()
+
+    def holder(self) -> str:
+        """PID recorded by the current lease holder ("unknown" if unreadable)."""
+        try:
+            return self.lock_path.read_text().strip() or "unknown"
+        except OSError:
+            return "unknown"
+
+    def is_leader(self) -> bool:
+        return self.acquired.is_set()
+
+    def release(self) -> None:
+        """Give up the lease (closing the descriptor drops the flock)."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            self.acquired.clear()
+
+
+class TmuxControl:
+    """Long-lived tmux control-mode client (tmux -C) used by the leader for all tmux traffic.
+
+    Commands are written to the client's stdin and answered in order with
+    %begin/%end (or %error) blocks, so a batch of commands is pipelined over one
+    connection. The session list is cached until tmux reports %sessions-changed
+    or %session-renamed. The client attaches with ignore-size,no-output so it
+    neither resizes windows nor receives pane output. If the client cannot be
+    started or dies, run() returns None and callers fall back to one-shot
+    tmux subprocesses.
+    """
+
+    SESSION_FORMAT = '#{session_name}:#{session_windows}:#{session_attached}:#{session_activity}'
+    RETRY_INTERVAL = 30.0  # seconds between reconnect attempts
+    TIMEOUT = 5.0  # seconds to wait for a batch of replies
+
+    def __init__(self) -> None:
+        self.process: subprocess.Popen[bytes] | None = None
+        self.pending: deque[list[Any]] = deque()  # [event, ok, lines] in command order (lines None = client died)
+        self.sessions: dict[str, dict[str, str]] | None = None
+        self.sessions_generation = 0
+        self._retry_at = 0.0
+        self._write_lock = threading.Lock()
+
+    @staticmethod
+    def quote(arg: str) -> str:
+        """Quote an argument for the tmux command parser."""
+        return "'" + arg.replace("'", "'\\''") + "'"
+
+    def alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def ensure_started(self) -> bool:
+        """Start (or restart) the control client, rate limited after failures."""
+        if self.alive():
+            return True
+
+        if time.monotonic() < self._retry_at:
+            return False
+        self._retry_at = time.monotonic() + self.RETRY_INTERVAL
+
+        try:
+            process = subprocess.Popen(
+                ['tmux', '-C', 'attach-session', '-f', 'ignore-size,no-output'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
+            )
+        except OSError as e:
+            logger.debug("tmux control mode unavailable: %s", e)
+            return False
+
+        self.process = process
+        self.sessions = None
+        threading.Thread(target=self._read_loop, args=(process,), daemon=True, name="tmux-control").start()
+        logger.debug("tmux control client started (PID %s)", process.pid)
+        return True
+
+    def _read_loop(self, process: subprocess.Popen[bytes]) -> None:
+        """Match %begin/%end blocks to pending commands and track notifications."""
+        assert process.stdout is not None
+        block: list[str] | None = None
+        block_number = ''
+
+        for raw in process.stdout:
+            line = raw.decode('utf-8', 'replace').rstrip('\r\n')
+
+            if block is not None:
+                parts = line.split(' ')
+                if parts[0] in ('%end', '%error') and len(parts) >= 3 and parts[2] == block_number:
+                    self._resolve(parts[0] == '%end', block)
+                    block = None
+                else:
+                    block.append(line)
+                continue
+
+            if line.startswith('%begin '):
+                parts = line.split(' ')
+                # flags=1 marks replies to our commands (the attach itself has flags=0)
+                if len(parts) >= 4 and parts[3] == '1':
+                    block = []
+                    block_number = parts[2]
+            elif line.startswith(('%sessions-changed', '%session-renamed')):
+                self.sessions = None
+                self.sessions_generation += 1
+            elif line.startswith('%exit'):
+                break
+
+        logger.debug("tmux control client exited")
+        process.wait()
+        # Unanswered commands are not failures: run() sees the client died and returns None
+        with self._write_lock:
+            while self.pending:
+                self._resolve(False, None)
+
+    def _resolve(self, ok: bool, lines: list[str] | None) -> None:
+        if self.pending:
+            entry = self.pending.popleft()
+            entry[1], entry[2] = ok, lines
+            entry[0].set()
+
+    def run(self, commands: list[list[str]]) -> list[tuple[bool, list[str]]] | None:
+        """Pipeline commands over the control client; None if it is not usable."""
+        if not self.ensure_started():
+            return None
+
+        process = self.process
+        assert process is not None and process.stdin is not None
+        entries = [[threading.Event(), False, []] for _ in commands]
+        payload = ''.join(' '.join(self.quote(arg) for arg in args) + '\n' for args in commands)
+
+        try:
+            with self._write_lock:
+                # The reader reaps the client before failing what is pending (under this
+                # lock), so a client that is still running here will answer or fail these
+                if process.poll() is not None:
+                    logger.debug("tmux control client is gone")
+                    self.close()
+                    return None
+                self.pending.extend(entries)
+                process.stdin.write(payload.encode())
+                process.stdin.flush()
+        except (OSError, ValueError) as e:
+            logger.debug("tmux control write failed: %s", e)
+            self.close()
+            return None
+
+        deadline = time.monotonic() + self.TIMEOUT
+        for entry in entries:
+            if not entry[0].wait(max(0.0, deadline - time.monotonic())):
+                # Replies out of step - drop the client, callers fall back
+                logger.warning("tmux control client timed out")
+                self.close()
+                return None
+
+        if any(entry[2] is None for entry in entries):
+            # Client exited (attached session killed, or tmux < 3.2 rejecting attach -f)
+            logger.debug("tmux control client died, falling back to subprocesses")
+            self.close()
+            return None
+
+        return [(entry[1], entry[2]) for entry in entries]
+
+    def list_sessions(self) -> dict[str, dict[str, str]] | None:
+        """Cached session list (refreshed after tmux reports a change)."""
+        if self.sessions is not None and self.alive():
+            return self.sessions
+
+        generation = self.sessions_generation
+        results = self.run([['list-sessions', '-F', self.SESSION_FORMAT]])
+        if results is None:
+            return None
+
+        ok, lines = results[0]
+        sessions = parse_tmux_sessions(lines) if ok else {}
+        if generation == self.sessions_generation:
+            self.sessions = sessions
+        return sessions
+
+    def close(self) -> None:
+        """Terminate the control client (pending commands fail)."""
+        process, self.process = self.process, None
+        if process is not None and process.poll() is None:
+            try:
+                assert process.stdin is not None
+                process.stdin.close()
+                process.wait(timeout=2)
+            except (OSError, subprocess.TimeoutExpired):
+                process.kill()
+
+
+def parse_tmux_sessions(lines: list[str]) -> dict[str, dict[str, str]]:
+    """Parse list-sessions output in TmuxControl.SESSION_FORMAT, keyed by session name."""
+    sessions: dict[str, dict[str, str]] = {}
+
+    for line in lines:
+        parts = line.rsplit(':', 3)
+        if len(parts) == 4:
+            session_name, session_windows, session_attached, session_activity = parts
+            sessions[session_name] = {'windows': session_windows, 'attached': session_attached, 'activity': session_activity}
+
+    return sessions
 
 
 class SessionMonitor:
     """File-based session monitoring with stale detection via mtime."""
 
+    # Push events sent by the session tools rather than the hook
+    EXPLICIT_EVENTS = ('register', 'heartbeat')
+    # Table fields set only through the session tools (kept when the file side is reparsed)
+    EXPLICIT_FIELDS = ('tmux_session', 'session_type', 'registered_at', 'last_heartbeat')
+    SESSION_STATUSES = ('active', 'stale', 'forgotten')
+
     def __init__(self) -> None:
+        # session_id -> {session_id, tmux_session, file_path, stamp, last_mtime, project_dir,
+        # todos, active_todo_count, session_type, registered_at, last_heartbeat};
+        # file_path is None for sessions known only from register_session/heartbeat
         self.sessions: dict[str, dict[str, Any]] = {}
         self.config = {
             "ping_interval": 30,  # seconds between monitoring checks
             "stale_timeout": 150,  # seconds of inactivity before stale
             "forget_timeout": 600,  # seconds of inactivity before forgotten (1 hour)
+            # Liveness signals: session file mtime and tmux window activity (pane output).
+            # Effective idle = min(idle / weight) over signals with weight > 0, so a
+            # higher weight trusts that signal more and 0 disables it.
+            "liveness_weights": parse_liveness_weights(os.environ.get('RESIN_AI_LIVENESS_WEIGHTS')),
             "continuation_messages": [
                 "Please continue working...\n",
                 "Continue with the next tasks...\n",
@@ -76,8 +694,18 @@ class SessionMonitor:
         self.tmux_available = False
         self._lock = threading.Lock()
         self.my_pid = os.getpid()
-        self._is_leader_cached: bool | None = None
-        self._leader_check_time: float = 0.0
+        self.lease = LeaderLease(get_sessions_root() / '.leader.lock')
+        self.tmux_control: TmuxControl | None = None  # leader only
+        self.push_channel: PushChannel | None = None  # leader only
+        self.watcher: SessionWatcher | None = None
+        self.scan_stats = {"scanned": 0, "parsed": 0, "skipped": 0, "failed": 0}  # per tick
+        self.scheduler = DeadlineScheduler()  # next threshold crossing per session
+        self.last_nudge: dict[str, float] = {}  # session_id -> time of last continuation
+        self.tmux_snapshot: dict[str, dict[str, str]] = {}  # latest per-tick tmux snapshot
+        self.pending_schedule: set[str] = set()  # sessions updated by tool calls, rescheduled next tick
+        self._push_sender: socket.socket | None = None  # follower side of the push channel
+        self.metrics = metrics.Metrics("resin_ai_ping_pong", {"ticks_total": "kind", "tick_duration_ms": "kind"})
+        self.metrics.collector(self._collect_metrics)
 
     def start_monitoring(self) -> None:
         """Start background monitoring thread."""
@@ -86,8 +714,8 @@ class SessionMonitor:
             return
 
         logger.debug("Starting session monitoring...")
-        logger.debug(f"PID: {self.my_pid}")
-        logger.debug(f"Config: ping_interval={self.config['ping_interval']}s, stale_timeout={self.config['stale_timeout']}s")
+        logger.debug("PID: %s", self.my_pid)
+        logger.debug("Config: ping_interval=%ss, stale_timeout=%ss", self.config['ping_interval'], self.config['stale_timeout'])
 
         self.tmux_available = self._check_tmux_available()
         if not self.tmux_available:
@@ -97,6 +725,7 @@ class SessionMonitor:
         logger.debug("✓ tmux is available")
 
         self.monitoring_enabled = True
+        self.lease.start()
         self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.monitor_thread.start()
         logger.info("✓ Session monitoring started successfully")
@@ -104,8 +733,14 @@ class SessionMonitor:
     def stop_monitoring(self) -> None:
         """Stop background monitoring thread."""
         self.monitoring_enabled = False
+        if self.watcher is not None:
+            self.watcher.wake()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=5)
+        self.lease.release()
+        if self._push_sender is not None:
+            self._push_sender.close()
+            self._push_sender = None
 
     def _check_tmux_available(self) -> bool:
         """Check if tmux is installed and available."""
@@ -122,452 +757,887 @@ class SessionMonitor:
 
     def _session_exists(self, tmux_session_name: str) -> bool:
         """Check if tmux session exists."""
-        if not self.tmux_available:
-            return False
+        return self._validate_session_exists(tmux_session_name)
+
+    def _run_tmux(self, commands: list[list[str]]) -> list[tuple[bool, list[str]]]:
+        """Run tmux commands over the control client, or as one-shot subprocesses."""
+        if self.tmux_control is not None:
+            results = self.tmux_control.run(commands)
+            if results is not None:
+                return results
 
+        results = []
+        for args in commands:
+            try:
+                result = subprocess.run(['tmux', *args], capture_output=True, text=True, timeout=5)
+                results.append((result.returncode == 0, result.stdout.splitlines()))
+            except (FileNotFoundError, subprocess.SubprocessError) as e:
+                logger.debug("tmux %s failed: %s", args[0], e)
+                results.append((False, []))
+
+        return results
+
+    def _tmux_sessions(self) -> dict[str, dict[str, str]]:
+        """Current tmux sessions (cached by the control client between changes)."""
+        if self.tmux_control is not None:
+            sessions = self.tmux_control.list_sessions()
+            if sessions is not None:
+                return sessions
+
+        ok, lines = self._run_tmux([['list-sessions', '-F', TmuxControl.SESSION_FORMAT]])[0]
+        return parse_tmux_sessions(lines) if ok else {}
+
+    def _am_i_leader(self) -> bool:
+        """Check if this is the leader monitor (holder of the .sessions/.leader.lock lease)."""
+        return self.lease.is_leader()
+
+    @staticmethod
+    def _session_stamp(stat: os.stat_result) -> tuple[int, int, int]:
+        """Identity of a session file's content: (inode, mtime_ns, size)."""
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    @classmethod
+    def _explicit_fields(cls, session_id: str, known: dict[str, Any] | None) -> dict[str, Any]:
+        """Tool-set fields of a table entry: carried over from a registered entry, defaults otherwise."""
+        if known is None or known.get('registered_at') is None:
+            # tmux session name matches session_id (we rename it in the hook)
+            return {'tmux_session': session_id, 'session_type': 'claude_code', 'registered_at': None, 'last_heartbeat': None}
+
+        return {field: known.get(field) for field in cls.EXPLICIT_FIELDS}
+
+    @staticmethod
+    def _without_file(known: dict[str, Any]) -> dict[str, Any] | None:
+        """Entry left once a session file is gone: registered sessions stay on heartbeats alone."""
+        if known.get('registered_at') is None:
+            return None
+
+        return {**known, 'file_path': None, 'stamp': None, 'todos': [], 'active_todo_count': 0}
+
+    def _read_session_file(self, session_file: Path, project_name: str, stat: os.stat_result, known: dict[str, Any] | None = None) -> dict[str, Any] | None:
+        """Parse one session file into a session table entry (None if unreadable).
+
+        The caller's stat result is taken before the read, so a concurrent write
+        leaves a stale stamp behind and the file is simply reparsed next time.
+        If the content does not parse, the previously known todos are kept.
+        """
         try:
-            result = subprocess.run(
-                ['tmux', 'has-session', '-t', tmux_session_name],
-                capture_output=True,
-                timeout=2
-            )
-            return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+            # Session ID is the filename (without .json extension)
+            session_id = session_file.stem
 
-    def _am_i_leader(self, force_recheck: bool = False) -> bool:
-        """Check if this is the leader monitor (lowest PID among all ping-pong processes).
+            # Read todos from JSON file
+            file_content = session_file.read_text().strip()
+            try:
+                todos = json.loads(file_content) if file_content else []
+            except json.JSONDecodeError:
+                self.scan_stats["failed"] += 1
+                if known is not None:
+                    logger.warning("Failed to parse JSON in %s, keeping previous todos", session_file)
+                    todos = known.get('todos', [])
+                else:
+                    logger.warning("Failed to parse JSON in %s, treating as empty todos", session_file)
+                    todos = []
+
+            explicit = self._explicit_fields(session_id, known)
+            tmux_session = explicit['tmux_session']
+
+            # File modification time (from the same stat as the stamp)
+            mtime = stat.st_mtime
+
+            # Count active/pending todos
+            active_todos = [t for t in todos if isinstance(t, dict) and t.get('status') in ['in_progress', 'pending']]
+            active_count_local = len(active_todos)
+
+            self.scan_stats["parsed"] += 1
+            logger.debug("Parsed session: id=%s, tmux_session=%s, todos=%s (%s active), idle=%.1fs, file=%s", session_id, tmux_session, len(todos), active_count_local, time.time() - mtime, session_file)
+
+            return {
+                'session_id': session_id,
+                'tmux_session': tmux_session,
+                'file_path': str(session_file),
+                'stamp': self._session_stamp(stat),
+                'last_mtime': mtime,
+                'project_dir': project_name,
+                'todos': todos,
+                'active_todo_count': active_count_local,
+                **explicit
+            }
 
-        Results are cached for 60 seconds to reduce overhead. Use force_recheck=True to bypass cache.
-        """
-        current_time = time.time()
-        cache_ttl = 60.0  # Cache leader status for 60 seconds
+        except (IOError, OSError) as e:
+            self.scan_stats["failed"] += 1
+            logger.warning("Failed to read session file %s: %s", session_file, e)
+            return None
 
-        # Return cached result if still valid
-        if not force_recheck and self._is_leader_cached is not None:
-            if current_time - self._leader_check_time < cache_ttl:
-                logger.debug(f"Using cached leader status: {self._is_leader_cached} (age: {current_time - self._leader_check_time:.1f}s)")
-                return self._is_leader_cached
+    def _load_session(self, session_file: Path, project_name: str, stat: os.stat_result, known: dict[str, Any] | None) -> dict[str, Any] | None:
+        """Return the table entry for a session file, reparsing only if its stamp changed."""
+        self.scan_stats["scanned"] += 1
 
-        try:
-            logger.debug(f"Leader election starting: my_pid={self.my_pid}")
+        if known is not None and known.get('file_path') == str(session_file) and known.get('stamp') == self._session_stamp(stat):
+            self.scan_stats["skipped"] += 1
+            return known
 
-            # Find all ping-pong.py processes using ps + grep
-            # Pattern matches: python3 -c ... exec(open('ping-pong.py').read())
-            # Using ps is more reliable than pgrep across different systems
-            result = subprocess.run(
-                ['sh', '-c', 'ps -eo pid,command | grep "[e]xec.*ping-pong" | awk \'{print $1}\''],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
+        return self._read_session_file(session_file, project_name, stat, known)
 
-            logger.debug(f"ps+grep result: returncode={result.returncode}, stdout='{result.stdout.strip()}'")
+    def _scan_project(self, project_dir: Path, previous: dict[str, dict[str, Any]], discovered: dict[str, dict[str, Any]]) -> int:
+        """Add a project's sessions to discovered, stat'ing each file once via scandir."""
+        session_count = 0
 
-            if result.returncode != 0 or not result.stdout.strip():
-                # No processes found, we're the leader
-                logger.debug(f"No ping-pong processes found, assuming leader")
-                is_leader = True
-            else:
-                # Parse PIDs
-                pids = []
-                for line in result.stdout.strip().split('\n'):
-                    line = line.strip()
-                    if line:
-                        try:
-                            pid = int(line)
-                            pids.append(pid)
-                            logger.debug(f"Found ping-pong process: PID {pid}")
-                        except ValueError as e:
-                            logger.warning(f"Failed to parse PID from line '{line}': {e}")
-                            continue
-
-                if not pids:
-                    # No valid PIDs found, we're the leader
-                    logger.debug(f"No valid PIDs found, assuming leader")
-                    is_leader = True
-                else:
-                    # We're the leader if we have the lowest PID
-                    min_pid = min(pids)
-                    is_leader = self.my_pid == min_pid
-
-                    logger.debug(f"Leader election results:")
-                    logger.debug(f"  - My PID: {self.my_pid}")
-                    logger.debug(f"  - Leader PID: {min_pid}")
-                    logger.debug(f"  - All PIDs: {sorted(pids)}")
-                    logger.debug(f"  - Process count: {len(pids)}")
-
-            # Cache the result
-            self._is_leader_cached = is_leader
-            self._leader_check_time = current_time
-
-            # Only log on status change or first check
-            if is_leader:
-                logger.info(f"✓ LEADER monitor elected (PID {self.my_pid})")
-            else:
-                min_pid = min(pids) if pids else "unknown"
-                logger.info(f"✗ FOLLOWER monitor (PID {self.my_pid}, leader: {min_pid})")
+        # Scan for session files (*.json)
+        try:
+            entries = list(os.scandir(project_dir))
+        except OSError as e:
+            logger.debug("Failed to scan %s: %s", project_dir, e)
+            return 0
 
-            return is_leader
+        for entry in entries:
+            if not entry.name.endswith('.json'):
+                continue
 
-        except (subprocess.SubprocessError, subprocess.TimeoutExpired, ValueError) as e:
-            logger.warning(f"Leader election failed: {e}, assuming leader by default")
-            # Cache failure result briefly
-            self._is_leader_cached = True
-            self._leader_check_time = current_time
-            return True  # Assume leader if can't determine
+            try:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
 
-    def _discover_sessions(self) -> dict[str, dict[str, Any]]:
-        """Discover all session files by scanning .sessions directories."""
-        discovered: dict[str, dict[str, Any]] = {}
+            session_file = Path(entry.path)
+            session_data = self._load_session(session_file, project_dir.name, stat, previous.get(session_file.stem))
+            if session_data is None:
+                continue
 
-        # Use CLAUDE_PLUGIN_ROOT for .sessions storage (system-wide)
-        plugin_root = os.environ.get('CLAUDE_PLUGIN_ROOT')
+            discovered[session_data['session_id']] = session_data
+            session_count += 1
 
-        if plugin_root:
-            plugin_dir = Path(plugin_root)
-        else:
-            plugin_dir = Path('.')
+        return session_count
 
-        sessions_root = plugin_dir / '.sessions'
+    def _discover_sessions(self) -> dict[str, dict[str, Any]]:
+        """Discover all session files by scanning .sessions directories (mtime-diff, unchanged files are not reparsed)."""
+        discovered: dict[str, dict[str, Any]] = {}
+        sessions_root = get_sessions_root()
 
-        logger.debug(f"Session discovery: plugin_dir={plugin_dir}, sessions_root={sessions_root}")
+        logger.debug("Session discovery: sessions_root=%s", sessions_root)
 
         if not sessions_root.exists():
-            logger.debug(f"Sessions root does not exist: {sessions_root}")
+            logger.debug("Sessions root does not exist: %s", sessions_root)
             return discovered
 
+        with self._lock:
+            previous = dict(self.sessions)
+
         # Scan all normalized project directories
-        for project_dir_entry in sessions_root.iterdir():
-            if not project_dir_entry.is_dir():
+        for project_dir_entry in os.scandir(sessions_root):
+            if not project_dir_entry.is_dir(follow_symlinks=False):
                 continue
 
-            logger.debug(f"Scanning project directory: {project_dir_entry.name}")
+            session_count = self._scan_project(Path(project_dir_entry.path), previous, discovered)
+            logger.debug("Found %s sessions in %s", session_count, project_dir_entry.name)
 
-            # Scan for session files (*.json)
-            session_count = 0
-            for session_file in project_dir_entry.glob('*.json'):
-                try:
-                    # Session ID is the filename (without .json extension)
-                    session_id = session_file.stem
-
-                    # Read todos from JSON file
-                    file_content = session_file.read_text().strip()
-                    try:
-                        todos = json.loads(file_content) if file_content else []
-                    except json.JSONDecodeError:
-                        logger.warning(f"Failed to parse JSON in {session_file}, treating as empty todos")
-                        todos = []
-
-                    # tmux session name matches session_id (we rename it in the hook)
-                    tmux_session = session_id
-
-                    # Get file modification time
-                    mtime = session_file.stat().st_mtime
-                    current_time = time.time()
-                    idle_seconds = current_time - mtime
-
-                    # Count active/pending todos
-                    active_todos = [t for t in todos if isinstance(t, dict) and t.get('status') in ['in_progress', 'pending']]
-                    active_count_local = len(active_todos)
-
-                    discovered[session_id] = {
-                        'session_id': session_id,
-                        'tmux_session': tmux_session,
-                        'file_path': str(session_file),
-                        'last_mtime': mtime,
-                        'project_dir': project_dir_entry.name,
-                        'todos': todos,
-                        'active_todo_count': active_count_local
-                    }
+        logger.debug("Total sessions discovered: %s", len(discovered))
+        return discovered
 
-                    session_count += 1
-                    logger.debug(f"Discovered session: id={session_id}, tmux_session={tmux_session}, todos={len(todos)} ({active_count_local} active), idle={idle_seconds:.1f}s, file={session_file}")
+    def _apply_session_changes(self, changed: set[Path]) -> set[str]:
+        """Update the session table in place for the paths reported by the watcher.
 
-                except (IOError, OSError) as e:
-                    logger.warning(f"Failed to read session file {session_file}: {e}")
+        Returns the IDs of sessions that were added, updated or removed.
+        """
+        with self._lock:
+            previous = dict(self.sessions)
+
+        updates: dict[str, dict[str, Any] | None] = {}
+
+        for path in changed:
+            if path.suffix == '.json':
+                # Single session file written, touched, replaced or removed
+                session_id = path.stem
+                try:
+                    stat = path.stat()
+                except OSError:
+                    if previous.get(session_id, {}).get('file_path') == str(path):
+                        updates[session_id] = None
                     continue
 
-            logger.debug(f"Found {session_count} sessions in {project_dir_entry.name}")
+                updates[session_id] = self._load_session(path, path.parent.name, stat, previous.get(session_id))
+            else:
+                # Project directory created, moved or removed - rescan just that directory
+                for session_id, session_data in previous.items():
+                    if session_data.get('project_dir') == path.name:
+                        updates[session_id] = None
 
-        logger.debug(f"Total sessions discovered: {len(discovered)}")
-        return discovered
+                if path.is_dir():
+                    rescanned: dict[str, dict[str, Any]] = {}
+                    self._scan_project(path, previous, rescanned)
+                    updates.update(rescanned)
 
-    def _validate_session_exists(self, tmux_session: str) -> bool:
-        """Validate that a tmux session actually exists and is active."""
-        if not self.tmux_available or tmux_session == 'none':
-            return False
+        with self._lock:
+            for session_id, session_data in updates.items():
+                if session_data is None:
+                    self._remove_file_side(session_id, "file removed")
+                else:
+                    if session_id not in self.sessions:
+                        logger.info("Session added: %s", session_id)
+                    self.sessions[session_id] = session_data
 
-        try:
-            # Use tmux has-session to check if session exists
-            result = subprocess.run(
-                ['tmux', 'has-session', '-t', tmux_session],
-                capture_output=True,
-                timeout=2
-            )
+        return set(updates)
 
-            if result.returncode != 0:
-                logger.debug(f"Session validation failed: session {tmux_session} does not exist (returncode={result.returncode})")
-                return False
+    def _remove_file_side(self, session_id: str, reason: str) -> None:
+        """Drop a session whose file is gone, or keep it on heartbeats alone if registered (caller holds the lock)."""
+        known = self.sessions.get(session_id)
+        if known is None:
+            return
 
-            # Get session info to verify it's active
-            result = subprocess.run(
-                ['tmux', 'display-message', '-t', tmux_session, '-p', '#{session_name}:#{session_windows}:#{session_attached}'],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
+        kept = self._without_file(known)
+        if kept is None:
+            del self.sessions[session_id]
+            logger.info("Session removed: %s (%s)", session_id, reason)
+        else:
+            self.sessions[session_id] = kept
+            logger.debug("Session file gone, keeping registered session: %s (%s)", session_id, reason)
+
+    def _tmux_snapshot(self) -> dict[str, dict[str, str]]:
+        """One pipelined snapshot of tmux sessions plus their latest window activity."""
+        sessions_result, windows_result = self._run_tmux([
+            ['list-sessions', '-F', TmuxControl.SESSION_FORMAT],
+            ['list-windows', '-a', '-F', '#{session_name}:#{window_activity}']
+        ])
+
+        sessions = parse_tmux_sessions(sessions_result[1]) if sessions_result[0] else {}
+
+        if windows_result[0]:
+            for line in windows_result[1]:
+                session_name, _, window_activity = line.rpartition(':')
+                info = sessions.get(session_name)
+                if info is not None and window_activity.isdigit():
+                    info['window_activity'] = max(info.get('window_activity', '0'), window_activity, key=int)
+
+        return sessions
+
+    @staticmethod
+    def _signals(session_data: dict[str, Any], tmux_info: dict[str, str] | None, current_time: float) -> dict[str, float]:
+        """Latest activity timestamp per liveness signal available for a session."""
+        signals: dict[str, float] = {}
+
+        # Heartbeat first: a registered-only session's file signal is its registration time
+        if session_data.get("last_heartbeat") is not None:
+            signals["heartbeat"] = session_data["last_heartbeat"]
+
+        signals["file"] = session_data.get("last_mtime", current_time)
+
+        if tmux_info is not None and tmux_info.get('window_activity', '').isdigit():
+            signals["tmux"] = float(tmux_info['window_activity'])
+
+        return signals
+
+    def _liveness(self, session_data: dict[str, Any], tmux_info: dict[str, str] | None, current_time: float) -> tuple[float, str]:
+        """Effective idle seconds for a session and the signal that determined it.
+
+        Combines the session file mtime (hook activity) with explicit heartbeats
+        and the tmux window activity timestamp (pane output, e.g. a long-running
+        tool) using the configured liveness_weights.
+        """
+        weights = self.config["liveness_weights"]
+        signals = self._signals(session_data, tmux_info, current_time)
+
+        best_idle, best_signal = float('inf'), "none"
+        for name, timestamp in signals.items():
+            weight = weights.get(name, 0.0)
+            if weight <= 0:
+                continue
+
+            idle = max(0.0, current_time - timestamp) / weight
+            if idle < best_idle:
+                best_idle, best_signal = idle, name
+
+        if best_signal == "none":
+            # Every signal disabled - fall back to the file mtime
+            return max(0.0, current_time - signals["file"]), "file"
+
+        return best_idle, best_signal
+
+    def _crossing(self, session_data: dict[str, Any], tmux_info: dict[str, str] | None, timeout: float) -> float:
+        """Wall-clock time at which the session's effective idle exceeds timeout.
+
+        Inverse of _liveness(): min(idle / weight) > timeout holds once every
+        enabled signal is older than timeout * weight.
+        """
+        weights = self.config["liveness_weights"]
+        signals = self._signals(session_data, tmux_info, time.time())
+        file_time = signals["file"]
+
+        crossings = [timestamp + timeout * weights[name] for name, timestamp in signals.items() if weights.get(name, 0.0) > 0]
+        return max(crossings) if crossings else file_time + timeout
+
+    def _next_deadline(self, session_id: str, session_data: dict[str, Any], current_time: float) -> float | None:
+        """When the monitor next needs to look at this session (None = not until it changes)."""
+        tmux_info = self.tmux_snapshot.get(session_data.get("tmux_session") or '')
+        stale_at = self._crossing(session_data, tmux_info, self.config["stale_timeout"])
+        forget_at = self._crossing(session_data, tmux_info, self.config["forget_timeout"])
+
+        if current_time < stale_at:
+            deadline = stale_at
+        elif current_time < forget_at:
+            if session_data.get("active_todo_count", 0) > 0:
+                # Still stale with work left - re-nudge every ping_interval
+                deadline = self.last_nudge.get(session_id, current_time) + self.config["ping_interval"]
+            else:
+                deadline = forget_at
+        else:
+            # Forgotten: nothing to do until the session file changes
+            return None
+
+        # Land just past the threshold (staleness is a strict comparison)
+        return max(deadline, current_time) + 0.05
+
+    def _schedule_sessions(self, session_ids: set[str]) -> None:
+        """Recompute deadlines for sessions whose table entries changed."""
+        current_time = time.time()
+
+        with self._lock:
+            entries = {session_id: self.sessions.get(session_id) for session_id in session_ids}
+
+        for session_id, session_data in entries.items():
+            if session_data is None:
+                self.scheduler.schedule(session_id, None)
+                self.last_nudge.pop(session_id, None)
+            else:
+                self.scheduler.schedule(session_id, self._next_deadline(session_id, session_data, current_time))
+
+    def _apply_push_messages(self, messages: list[dict[str, Any]]) -> set[str]:
+        """Update the session table from hook datagrams and session tool calls; returns the touched session IDs.
 
-            if result.returncode != 0:
-                logger.debug(f"Session info failed for {tmux_session}")
-                return False
+        Hook events move the file signal (last_mtime); register/heartbeat set
+        the explicit fields and the heartbeat signal, so both sources of a
+        session end up in one entry.
+        """
+        touched: set[str] = set()
+        sessions_root = get_sessions_root()
+
+        with self._lock:
+            for message in messages:
+                session_id = message['session_id']
+                event = message.get('event')
+                explicit = event in self.EXPLICIT_EVENTS
+
+                if message.get('removed'):
+                    if session_id in self.sessions:
+                        self._remove_file_side(session_id, str(event))
+                        touched.add(session_id)
+                    continue
+
+                ts = message.get('ts')
+                ts = float(ts) if isinstance(ts, (int, float)) else time.time()
+                active_todo_count = message.get('active_todo_count')
+                known = self.sessions.get(session_id)
+
+                # Entries are replaced, never mutated (readers copy the table without the lock)
+                if known is None:
+                    project_dir = str(message.get('project') or '')
+                    logger.info("Session added: %s (%s)", session_id, event)
+                    session_data = {
+                        'session_id': session_id,
+                        # Registered-only sessions have no file until the hook writes one
+                        'file_path': None if explicit else str(sessions_root / project_dir / f"{session_id}.json"),
+                        'stamp': None,  # reparsed from the file on its next change
+                        'last_mtime': ts,
+                        'project_dir': project_dir,
+                        'todos': [],
+                        'active_todo_count': active_todo_count if isinstance(active_todo_count, int) else 0,
+                        **self._explicit_fields(session_id, None)
+                    }
+                elif explicit:
+                    session_data = dict(known)
+                else:
+                    session_data = {**known, 'last_mtime': max(known.get('last_mtime', 0.0), ts)}
+
+                if explicit:
+                    # A heartbeat from an unregistered session registers it
+                    if session_data.get('registered_at') is None:
+                        session_data['registered_at'] = ts
+                    session_data['last_heartbeat'] = max(session_data.get('last_heartbeat') or 0.0, ts)
 
-            output = result.stdout.strip()
-            if not output:
-                logger.debug(f"Session validation failed: empty response for session {tmux_session}")
-                return False
+                    if event == 'register':
+                        for field in ('tmux_session', 'session_type'):
+                            value = message.get(field)
+                            if isinstance(value, str) and value:
+                                session_data[field] = value
 
-            parts = output.split(':')
-            if len(parts) >= 3:
-                session_name, session_windows, session_attached = parts[0], parts[1], parts[2]
-                logger.debug(f"Session {tmux_session} validated: name={session_name}, windows={session_windows}, attached={session_attached}")
-                return True
+                if known is not None and isinstance(active_todo_count, int):
+                    session_data['active_todo_count'] = active_todo_count
 
+                self.sessions[session_id] = session_data
+                touched.add(session_id)
+
+        return touched
+
+    def _validate_session_exists(self, tmux_session: str) -> bool:
+        """Validate that a tmux session actually exists and is active."""
+        if not self.tmux_available or tmux_session == 'none':
             return False
 
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError) as e:
-            logger.error(f"Session validation error for {tmux_session}: {e}")
+        info = self._tmux_sessions().get(tmux_session)
+        if info is None:
+            logger.debug("Session validation failed: session %s does not exist", tmux_session)
             return False
 
+        logger.debug("Session %s validated: windows=%s, attached=%s", tmux_session, info['windows'], info['attached'])
+        return True
+
     def _send_continuation_prompt_to_session(self, tmux_session: str, message: str) -> bool:
         """Send continuation prompt to specific tmux session."""
-        if not self.tmux_available or tmux_session == 'none':
-            logger.warning(f"Cannot send prompt - tmux unavailable or no session: {tmux_session}")
-            return False
+        return self._send_continuation_prompts([(tmux_session, message)]).get(tmux_session, False)
 
-        # Validate session exists before sending
-        if not self._validate_session_exists(tmux_session):
-            logger.warning(f"Cannot send prompt - session {tmux_session} does not exist")
-            return False
+    def _send_continuation_prompts(self, targets: list[tuple[str, str]], tmux_sessions: dict[str, dict[str, str]] | None = None) -> dict[str, bool]:
+        """Send continuation prompts to several tmux sessions in two pipelined batches.
 
-        try:
-            logger.debug(f"Sending continuation prompt to session {tmux_session}")
-            logger.debug(f"Message: {repr(message)}")
+        All messages are typed first, then a single 0.5s pause, then all Enters,
+        so N sessions cost one pause instead of N. Messages are sent literally
+        (send-keys -l) with the trailing newline left to the Enter key. Pass the
+        tick's tmux_sessions snapshot to skip the extra validation lookup.
+        """
+        sent: dict[str, bool] = {}
 
-            # Send the message to the tmux session
-            result1 = subprocess.run(
-                ['tmux', 'send-keys', '-t', tmux_session, message],
-                capture_output=True,
-                timeout=5
-            )
-            logger.debug(f"send-keys (message) result: returncode={result1.returncode}")
+        if not self.tmux_available:
+            logger.warning("Cannot send prompt - tmux unavailable")
+            return {tmux_session: False for tmux_session, _ in targets}
+
+        # Validate sessions exist before sending
+        if tmux_sessions is None:
+            tmux_sessions = self._tmux_sessions()
+        valid: list[tuple[str, str]] = []
+        for tmux_session, message in targets:
+            if tmux_session == 'none' or tmux_session not in tmux_sessions:
+                logger.warning("Cannot send prompt - session %s does not exist", tmux_session)
+                sent[tmux_session] = False
+            else:
+                logger.debug("Sending continuation prompt to session %s: %r", tmux_session, message)
+                valid.append((tmux_session, message))
 
-            time.sleep(0.5)
+        if not valid:
+            return sent
 
-            # Send Enter to execute
-            result2 = subprocess.run(
-                ['tmux', 'send-keys', '-t', tmux_session, 'Enter'],
-                capture_output=True,
-                timeout=5
-            )
-            logger.debug(f"send-keys (Enter) result: returncode={result2.returncode}")
+        # Type the messages, wait once, then press Enter everywhere
+        typed = self._run_tmux([['send-keys', '-t', tmux_session, '-l', message.rstrip('\n')] for tmux_session, message in valid])
 
-            logger.info(f"✓ Continuation prompt sent to session: {tmux_session}")
-            return True
+        time.sleep(0.5)
 
-        except (subprocess.TimeoutExpired, Exception) as e:
-            logger.error(f"✗ Failed to send prompt to session {tmux_session}: {e}")
-            import traceback
-            traceback.print_exc(file=sys.stderr)
-            return False
+        entered = self._run_tmux([['send-keys', '-t', tmux_session, 'Enter'] for tmux_session, _ in valid])
+
+        for (tmux_session, _), (typed_ok, _), (entered_ok, _) in zip(valid, typed, entered):
+            sent[tmux_session] = typed_ok and entered_ok
+            if sent[tmux_session]:
+                logger.info("✓ Continuation prompt sent to session: %s", tmux_session)
+            else:
+                logger.error("✗ Failed to send prompt to session %s", tmux_session)
+
+        return sent
 
     def _monitor_loop(self) -> None:
-        """Background monitoring loop - discovers sessions from files."""
+        """Background monitoring loop - sleeps until a session deadline or a file event."""
         loop_iteration = 0
+
+        # Followers sleep here until the leader exits (only the leader monitors)
+        self.lease.acquired.wait()
+        if not self.monitoring_enabled:
+            return
+
+        self.tmux_control = TmuxControl()
+        self.watcher = SessionWatcher(get_sessions_root(), self.config["ping_interval"])
+        self.push_channel = PushChannel(get_sessions_root() / 'monitor.sock')
+        if self.push_channel.open():
+            self.watcher.readers.append(self.push_channel.fileno())
+        changed: set[Path] | None = None  # None forces a full rescan
+
         while self.monitoring_enabled:
-            try:
-                loop_iteration += 1
-                logger.debug(f"========================================")
-                logger.debug(f"Monitor loop iteration #{loop_iteration}")
-                logger.debug(f"Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime())}")
+            self.scan_stats = {"scanned": 0, "parsed": 0, "skipped": 0, "failed": 0}
+            tick_kind = "rescan" if changed is None else "incremental"
+            tick_start = time.perf_counter()
 
-                # Discover sessions from files
-                logger.debug(f"Starting session discovery...")
-                file_sessions = self._discover_sessions()
+            try:
+                # Activity pushed by hooks lands in the table first (files may lag behind)
+                pushed = self.push_channel.drain()
+                if pushed:
+                    self.metrics.inc("push_messages_total", amount=len(pushed))
+                    self._schedule_sessions(self._apply_push_messages(pushed))
 
-                # Update in-memory sessions
+                # Sessions updated in place by this process's tool calls
                 with self._lock:
-                    old_count = len(self.sessions)
-                    self.sessions = file_sessions
-                    new_count = len(self.sessions)
+                    pending, self.pending_schedule = self.pending_schedule, set()
+                if pending:
+                    self._schedule_sessions(pending)
+
+                due: list[str] = []
+                if changed is None:
+                    loop_iteration += 1
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("========================================")
+                        logger.debug("Monitor loop iteration #%s", loop_iteration)
+                        logger.debug("Timestamp: %s", time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime()))
+
+                    # Full rescan (startup, polling fallback, or watcher overflow)
+                    logger.debug("Starting session discovery...")
+                    file_sessions = self._discover_sessions()
+
+                    # Update in-memory sessions (registered sessions outlive their files)
+                    with self._lock:
+                        old_count = len(self.sessions)
+                        for session_id, known in self.sessions.items():
+                            if session_id not in file_sessions:
+                                kept = self._without_file(known)
+                                if kept is not None:
+                                    file_sessions[session_id] = kept
+                        removed = set(self.sessions) - set(file_sessions)
+                        self.sessions = file_sessions
+                        new_count = len(self.sessions)
+
+                        if new_count != old_count:
+                            logger.info("Session count changed: %s -> %s", old_count, new_count)
+
+                    # Check every session (this also reschedules all deadlines)
+                    self._schedule_sessions(removed)
+                    self._check_stale_sessions()
+                else:
+                    if changed:
+                        # Event-driven: reparse only what changed and move its deadline
+                        self._schedule_sessions(self._apply_session_changes(changed))
 
-                    if new_count != old_count:
-                        logger.info(f"Session count changed: {old_count} -> {new_count}")
+                    # Check only the sessions whose deadline has arrived
+                    due = self.scheduler.pop_due(time.time())
+                    if due:
+                        logger.debug("Deadline reached for %s session(s)", len(due))
+                        self._check_stale_sessions(due)
 
-                # Check for stale sessions
-                logger.debug(f"Starting staleness check...")
-                self._check_stale_sessions()
+                if self.scan_stats["scanned"]:
+                    logger.debug("Session scan: scanned=%s, parsed=%s, skipped=%s, failed=%s", self.scan_stats['scanned'], self.scan_stats['parsed'], self.scan_stats['skipped'], self.scan_stats['failed'])
 
-                logger.debug(f"Monitor loop iteration #{loop_iteration} complete")
-                logger.debug(f"Next check in {self.config['ping_interval']} seconds")
+                # Wakeups with nothing to do (e.g. other files in .sessions/) are not counted as ticks
+                if changed is None or changed or pushed or pending or due:
+                    self._record_tick(tick_kind, (time.perf_counter() - tick_start) * 1000)
 
             except Exception as e:
-                logger.error(f"Monitor loop error in iteration #{loop_iteration}: {e}")
+                self.metrics.inc("tick_errors_total")
+                logger.error("Monitor loop error in iteration #%s: %s", loop_iteration, e)
                 import traceback
                 traceback.print_exc(file=sys.stderr)
+                changed = None
+                time.sleep(1)
+                continue
+
+            # Sleep until the next deadline, a file event, or a wake()
+            next_deadline = self.scheduler.next_deadline()
+            timeout = None if next_deadline is None else max(0.0, next_deadline - time.time())
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Next deadline in %s (%s scheduled)", '-' if timeout is None else f'{timeout:.1f}s', len(self.scheduler))
+            changed = self.watcher.wait(timeout)
+
+        self.watcher.close()
+        self.tmux_control.close()
+        self.push_channel.close()
+
+    def _record_tick(self, kind: str, elapsed_ms: float) -> None:
+        """Fold one monitor tick (duration and scan counts) into the metrics."""
+        self.metrics.inc("ticks_total", kind)
+        self.metrics.observe("tick_duration_ms", elapsed_ms, kind)
+        for key, value in self.scan_stats.items():
+            if value:
+                self.metrics.inc(f"sessions_{key}_total", amount=value)
+
+    def _collect_metrics(self) -> None:
+        """Refresh the series read on demand (leader status, table and schedule sizes)."""
+        self.metrics.set("leader", 1 if self.lease.is_leader() else 0)
+        self.metrics.set("monitoring_enabled", 1 if self.monitoring_enabled else 0)
+        self.metrics.set("sessions_tracked", len(self.sessions))
+        self.metrics.set("sessions_scheduled", len(self.scheduler))
+
+    def stats(self) -> dict[str, Any]:
+        """Metrics snapshot for the stats tool (ticks and nudges are only recorded by the leader)."""
+        return {
+            "pid": self.my_pid,
+            "leader": self.lease.is_leader(),
+            "leader_pid": self.lease.holder(),
+            "tmux_available": self.tmux_available,
+            **self.metrics.snapshot()
+        }
 
-            time.sleep(self.config["ping_interval"])
+    def _check_stale_sessions(self, session_ids: list[str] | None = None) -> None:
+        """Check sessions (default: all) for staleness using file mtime and tmux activity (leader only).
 
-    def _check_stale_sessions(self) -> None:
-        """Check all sessions for staleness using file mtime (leader only)."""
+        Each checked session is rescheduled at its next threshold crossing.
+        """
         # Only leader sends continuation prompts
         is_leader = self._am_i_leader()
 
         if not is_leader:
-            logger.debug(f"Skipping staleness check - not leader")
+            logger.debug("Skipping staleness check - not leader")
             return
 
-        logger.debug(f"Running staleness check as LEADER")
+        logger.debug("Running staleness check as LEADER")
         current_time = time.time()
         stale_count = 0
         active_count = 0
         forgotten_count = 0
 
+        continuations: list[tuple[str, str, str]] = []  # (session_id, tmux_session, message)
+        expired: list[tuple[str, dict[str, Any]]] = []  # forgotten sessions with no file left
+
+        # Copy the table under the lock; everything slow happens outside it
         with self._lock:
-            total_sessions = len(self.sessions)
-            logger.debug(f"Checking {total_sessions} sessions (stale_timeout={self.config['stale_timeout']}s, forget_timeout={self.config['forget_timeout']}s)")
-
-            for session_id, session_data in list(self.sessions.items()):
-                # Check staleness based on file mtime
-                last_mtime = session_data.get("last_mtime", current_time)
-                time_since_activity = current_time - last_mtime
-                is_stale = time_since_activity > self.config["stale_timeout"]
-                is_forgotten = time_since_activity > self.config["forget_timeout"]
-                tmux_session = session_data.get("tmux_session")
-                active_todo_count = session_data.get("active_todo_count", 0)
-                todos = session_data.get("todos", [])
-
-                logger.debug(f"Session {session_id}: idle={time_since_activity:.1f}s, stale={is_stale}, forgotten={is_forgotten}, tmux_session={tmux_session}, active_todos={active_todo_count}")
-
-                if is_forgotten:
-                    # Session has been idle too long, don't try to revive it
-                    forgotten_count += 1
-                    logger.info(f"💤 Forgotten session (idle {time_since_activity:.0f}s > {self.config['forget_timeout']}s): {session_id} - skipping continuation")
-                elif is_stale:
-                    # Session is stale but not forgotten
-                    # Only send continuation if there are active/pending todos
-                    if active_todo_count > 0:
-                        stale_count += 1
-                        logger.warning(f"⚠️  Stale session detected: {session_id} ({time_since_activity:.0f}s idle, threshold={self.config['stale_timeout']}s)")
-                        logger.info(f"🔧 Session {session_id} has {active_todo_count} active todos - sending continuation")
-
-                        # Send continuation prompt to tmux session
-                        if tmux_session and tmux_session != "none":
-                            message = random.choice(self.config["continuation_messages"])
-                            logger.info(f"Sending continuation to session {tmux_session} for session {session_id}")
-                            success = self._send_continuation_prompt_to_session(tmux_session, message)
-                            if success:
-                                logger.info(f"✓ Continuation sent successfully to {session_id}")
-                            else:
-                                logger.error(f"✗ Failed to send continuation to {session_id}")
-                        else:
-                            logger.warning(f"Cannot send continuation - no valid tmux session for {session_id}")
+            if session_ids is None:
+                table = list(self.sessions.items())
+            else:
+                table = [(session_id, self.sessions[session_id]) for session_id in session_ids if session_id in self.sessions]
+
+        # One tmux snapshot per tick, joined with the table in memory
+        tmux_sessions = self._tmux_snapshot() if table else {}
+        self.tmux_snapshot = tmux_sessions
+
+        total_sessions = len(table)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        self.metrics.inc("sessions_checked_total", amount=total_sessions)
+        logger.debug("Checking %s sessions (stale_timeout=%ss, forget_timeout=%ss)", total_sessions, self.config['stale_timeout'], self.config['forget_timeout'])
+
+        for session_id, session_data in table:
+            # Check staleness based on file mtime and tmux activity
+            tmux_session = session_data.get("tmux_session")
+            time_since_activity, liveness_signal = self._liveness(session_data, tmux_sessions.get(tmux_session or ''), current_time)
+            is_stale = time_since_activity > self.config["stale_timeout"]
+            is_forgotten = time_since_activity > self.config["forget_timeout"]
+            active_todo_count = session_data.get("active_todo_count", 0)
+            todos = session_data.get("todos", [])
+
+            if debug:
+                logger.debug("Session %s: idle=%.1fs (by %s), stale=%s, forgotten=%s, tmux_session=%s (%s), active_todos=%s", session_id, time_since_activity, liveness_signal, is_stale, is_forgotten, tmux_session, 'live' if tmux_session in tmux_sessions else 'missing', active_todo_count)
+
+            if is_forgotten:
+                # Session has been idle too long, don't try to revive it
+                forgotten_count += 1
+                logger.info("💤 Forgotten session (idle %.0fs > %ss): %s - skipping continuation", time_since_activity, self.config['forget_timeout'], session_id)
+                if session_data.get("file_path") is None:
+                    # Known only from heartbeats - no file event will ever bring it back
+                    expired.append((session_id, session_data))
+            elif is_stale:
+                # Session is stale but not forgotten
+                # Only send continuation if there are active/pending todos
+                if active_todo_count > 0:
+                    stale_count += 1
+                    logger.warning("⚠️  Stale session detected: %s (%.0fs idle, threshold=%ss)", session_id, time_since_activity, self.config['stale_timeout'])
+                    logger.info("🔧 Session %s has %s active todos - sending continuation", session_id, active_todo_count)
+
+                    # Send continuation prompt to tmux session
+                    if tmux_session and tmux_session != "none":
+                        message = random.choice(self.config["continuation_messages"])
+                        logger.info("Sending continuation to session %s for session %s", tmux_session, session_id)
+                        continuations.append((session_id, tmux_session, message))
                     else:
-                        logger.debug(f"Session {session_id} is stale but has no active todos - skipping continuation")
-                        active_count += 1  # Count as active (no intervention needed)
+                        self.metrics.inc("nudges_failed_total")
+                        logger.warning("Cannot send continuation - no valid tmux session for %s", session_id)
                 else:
-                    active_count += 1
-
-            logger.debug(f"Staleness check complete: {active_count} active, {stale_count} stale, {forgotten_count} forgotten (total: {total_sessions})")
+                    logger.debug("Session %s is stale but has no active todos - skipping continuation", session_id)
+                    active_count += 1  # Count as active (no intervention needed)
+            else:
+                active_count += 1
+
+        # Nudge all stale sessions in one batch
+        if continuations:
+            sent = self._send_continuation_prompts([(tmux_session, message) for _, tmux_session, message in continuations], tmux_sessions)
+            for session_id, tmux_session, _ in continuations:
+                self.last_nudge[session_id] = current_time
+                if sent.get(tmux_session):
+                    self.metrics.inc("nudges_sent_total")
+                    logger.info("✓ Continuation sent successfully to %s", session_id)
+                else:
+                    self.metrics.inc("nudges_failed_total")
+                    logger.error("✗ Failed to send continuation to %s", session_id)
+
+        if expired:
+            with self._lock:
+                for session_id, session_data in expired:
+                    if self.sessions.get(session_id) is session_data:
+                        del self.sessions[session_id]
+                        self.last_nudge.pop(session_id, None)
+                        logger.info("Session removed: %s (forgotten, no session file)", session_id)
+
+        # Wake again exactly when each checked session next crosses a threshold
+        for session_id, session_data in table:
+            self.scheduler.schedule(session_id, self._next_deadline(session_id, session_data, current_time))
+
+        logger.debug("Staleness check complete: %s active, %s stale, %s forgotten (total: %s)", active_count, stale_count, forgotten_count, total_sessions)
+
+    def _submit(self, message: dict[str, Any]) -> str | None:
+        """Apply a register/heartbeat update and return how it was delivered.
+
+        The leader applies it to its session table in memory ("local") and
+        queues the session for rescheduling; a follower forwards it to the
+        leader over the push channel ("forwarded"). None means no leader is
+        listening.
+        """
+        if self.lease.is_leader():
+            touched = self._apply_push_messages([message])
+            with self._lock:
+                self.pending_schedule |= touched
 
-    def register_session(self, session_id: str, tmux_session_name: str | None = None, session_type: str = "claude_code") -> dict[str, Any]:
-        """Register a session for monitoring."""
-        current_time = time.time()
+            # Activity only moves a deadline later and an early deadline reschedules
+            # itself, so the monitor is woken just for sessions with none scheduled
+            if self.watcher is not None and any(session_id not in self.scheduler.deadlines for session_id in touched):
+                self.watcher.wake()
+            return "local"
 
+        try:
+            if self._push_sender is None:
+                self._push_sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                self._push_sender.setblocking(False)
+            self._push_sender.sendto(json.dumps(message, separators=(',', ':')).encode(), str(get_sessions_root() / 'monitor.sock'))
+        except OSError as e:
+            logger.debug("Push to leader failed: %s", e)
+            return None
+
+        return "forwarded"
+
+    def register_session(self, session_id: str, tmux_session: str | None = None, session_type: str = "claude_code") -> dict[str, Any]:
+        """Register a session for monitoring (its tmux session defaults to the session ID)."""
         # Validate tmux session if provided
-        if tmux_session_name and self.tmux_available:
-            if not self._session_exists(tmux_session_name):
+        if tmux_session and self.tmux_available:
+            if not self._session_exists(tmux_session):
                 return {
                     "success": False,
-                    "error": f"tmux session does not exist: {tmux_session_name}"
+                    "error": f"tmux session does not exist: {tmux_session}"
                 }
 
-        with self._lock:
-            self.sessions[session_id] = {
-                "tmux_session_name": tmux_session_name,
-                "type": session_type,
-                "last_activity": current_time,
-                "last_ping": current_time,
-                "missed_pings": 0,
-                "status": "active",
-                "registered_at": current_time
+        message: dict[str, Any] = {"session_id": session_id, "event": "register", "ts": time.time(), "session_type": session_type}
+        if tmux_session:
+            message["tmux_session"] = tmux_session
+
+        delivery = self._submit(message)
+        if delivery is None:
+            return {
+                "success": False,
+                "error": "No leader monitor is listening on .sessions/monitor.sock"
             }
 
-        logger.info(f"Registered session: {session_id} (type={session_type}, tmux={tmux_session_name})")
+        logger.info("Registered session: %s (type=%s, tmux=%s, %s)", session_id, session_type, tmux_session or session_id, delivery)
 
         return {
             "success": True,
             "session_id": session_id,
+            "tmux_session": tmux_session or session_id,
+            "delivery": delivery,
             "tmux_available": self.tmux_available,
             "monitoring_enabled": self.monitoring_enabled
         }
 
-    def heartbeat(self, session_id: str) -> dict[str, Any]:
-        """Update session activity timestamp."""
-        with self._lock:
-            if session_id not in self.sessions:
-                return {
-                    "success": False,
-                    "error": f"Session not registered: {session_id}"
-                }
+    def heartbeat(self, session_id: str, active_todo_count: int | None = None) -> dict[str, Any]:
+        """Record explicit activity for a session (registers it if unknown)."""
+        current_time = time.time()
 
-            current_time = time.time()
-            self.sessions[session_id]["last_activity"] = current_time
-            self.sessions[session_id]["last_ping"] = current_time
-            self.sessions[session_id]["status"] = "active"
-            self.sessions[session_id]["missed_pings"] = 0
+        message: dict[str, Any] = {"session_id": session_id, "event": "heartbeat", "ts": current_time}
+        if active_todo_count is not None:
+            message["active_todo_count"] = active_todo_count
+
+        delivery = self._submit(message)
+        if delivery is None:
+            return {
+                "success": False,
+                "error": "No leader monitor is listening on .sessions/monitor.sock"
+            }
 
         return {
             "success": True,
             "session_id": session_id,
-            "timestamp": current_time
+            "timestamp": current_time,
+            "delivery": delivery
         }
 
     def mark_stale(self, session_id: str) -> dict[str, Any]:
-        """Explicitly mark session as stale and trigger continuation."""
+        """Explicitly mark session as stale and send a continuation prompt now."""
         with self._lock:
-            if session_id not in self.sessions:
-                return {
-                    "success": False,
-                    "error": f"Session not registered: {session_id}"
-                }
-
-            session_data = self.sessions[session_id]
-            session_data["status"] = "stale"
-
-            tmux_session_name = session_data.get("tmux_session_name")
-            if not tmux_session_name:
-                return {
-                    "success": False,
-                    "error": "No tmux session associated"
-                }
+            known = self.sessions.get(session_id)
+
+        # Followers keep no table; the hook names the tmux session after the session ID
+        tmux_session = known.get("tmux_session") if known is not None else session_id
+        if not tmux_session or tmux_session == "none":
+            return {
+                "success": False,
+                "error": "No tmux session associated"
+            }
 
-            # Send continuation prompt immediately
-            message = random.choice(self.config["continuation_messages"])
-            success = self._send_continuation_prompt(tmux_session_name, message)
+        # Send continuation prompt immediately (tmux round trips happen outside the lock)
+        message = random.choice(self.config["continuation_messages"])
+        success = self._send_continuation_prompt_to_session(tmux_session, message)
+        self.metrics.inc("nudges_sent_total" if success else "nudges_failed_total")
 
-            if success:
-                # Reset activity after sending prompt
-                current_time = time.time()
-                session_data["last_activity"] = current_time
-                session_data["status"] = "active"
+        if self.lease.is_leader():
+            # The next automatic re-nudge waits a full ping_interval from now
+            self.last_nudge[session_id] = time.time()
+            with self._lock:
+                self.pending_schedule.add(session_id)
+            if self.watcher is not None:
+                self.watcher.wake()
 
         return {
             "success": success,
             "session_id": session_id,
+            "tmux_session": tmux_session,
             "action": "continuation_sent" if success else "failed"
         }
 
+    def list_sessions(self, project: str | None = None, status: str | None = None, has_active_todos: bool | None = None, registered: bool | None = None) -> dict[str, Any]:
+        """Tracked sessions with their liveness, optionally filtered.
+
+        The leader answers from its session table and the tmux snapshot of its
+        last tick (no file or tmux access); a follower scans the session files,
+        so it only sees file-backed sessions and file liveness.
+        """
+        if self.lease.is_leader():
+            with self._lock:
+                table = list(self.sessions.values())
+            tmux_sessions = self.tmux_snapshot
+            source = "leader"
+        else:
+            table = list(self._discover_sessions().values())
+            tmux_sessions = {}
+            source = "files"
+
+        current_time = time.time()
+        sessions: list[dict[str, Any]] = []
+
+        for session_data in table:
+            if project is not None and project not in session_data.get("project_dir", ""):
+                continue
+            if has_active_todos is not None and (session_data.get("active_todo_count", 0) > 0) != has_active_todos:
+                continue
+            if registered is not None and (session_data.get("registered_at") is not None) != registered:
+                continue
+
+            idle, liveness_signal = self._liveness(session_data, tmux_sessions.get(session_data.get("tmux_session") or ''), current_time)
+            if idle > self.config["forget_timeout"]:
+                session_status = "forgotten"
+            elif idle > self.config["stale_timeout"]:
+                session_status = "stale"
+            else:
+                session_status = "active"
+
+            if status is not None and session_status != status:
+                continue
+
+            sessions.append({
+                "session_id": session_data["session_id"],
+                "project_dir": session_data.get("project_dir", ""),
+                "tmux_session": session_data.get("tmux_session"),
+                "session_type": session_data.get("session_type", "claude_code"),
+                "status": session_status,
+                "idle_seconds": round(idle, 1),
+                "liveness_signal": liveness_signal,
+                "active_todo_count": session_data.get("active_todo_count", 0),
+                "registered": session_data.get("registered_at") is not None,
+                "has_file": session_data.get("file_path") is not None,
+                "last_heartbeat": session_data.get("last_heartbeat")
+            })
+
+        sessions.sort(key=lambda entry: (entry["project_dir"], entry["session_id"]))
+
+        return {
+            "source": source,
+            "leader_pid": self.lease.holder(),
+            "count": len(sessions),
+            "sessions": sessions
+        }
 
 
 class PingPongMCPServer:
@@ -601,9 +1671,103 @@ class PingPongMCPServer:
     def handle_tools_list(self, _: dict[str, JsonValue]) -> dict[str, JsonValue]:
         """Handle tools/list request - list available tools."""
         return {
-            "tools": []
+            "tools": [{
+                "name": "register_session",
+                "description": "Register a session with the monitor so it is tracked (and revived when stale) even before or without hook-written session files. Optional: sessions that use the plugin hooks are discovered automatically.",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "session_id": {
+                            "type": "string",
+                            "description": "Session ID (the Claude Code session ID for hook-tracked sessions)"
+                        },
+                        "tmux_session": {
+                            "type": "string",
+                            "description": "tmux session that receives continuation prompts (default: the session ID)"
+                        },
+                        "session_type": {
+                            "type": "string",
+                            "description": "Free-form session type (default: `claude_code`)"
+                        }
+                    },
+                    "required": ["session_id"]
+                }
+            }, {
+                "name": "heartbeat",
+                "description": "Report that a session is alive. Updates the monitor's in-memory session table directly (no file write); an unknown session is registered on its first heartbeat.",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "session_id": {
+                            "type": "string",
+                            "description": "Session ID"
+                        },
+                        "active_todo_count": {
+                            "type": "integer",
+                            "minimum": 0,
+                            "description": "Number of in-progress or pending todos (stale sessions are only revived while this is above 0)"
+                        }
+                    },
+                    "required": ["session_id"]
+                }
+            }, {
+                "name": "mark_stale",
+                "description": "Treat a session as stale right away and send a continuation prompt to its tmux session.",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "session_id": {
+                            "type": "string",
+                            "description": "Session ID"
+                        }
+                    },
+                    "required": ["session_id"]
+                }
+            }, {
+                "name": "list_sessions",
+                "description": "List the monitored sessions with their status (`active`, `stale` or `forgotten`), idle time, liveness signal and open todo count. All filters are optional and combined.",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "project": {
+                            "type": "string",
+                            "description": "Only sessions whose normalized project directory contains this text"
+                        },
+                        "status": {
+                            "type": "string",
+                            "enum": list(SessionMonitor.SESSION_STATUSES),
+                            "description": "Only sessions with this status"
+                        },
+                        "has_active_todos": {
+                            "type": "boolean",
+                            "description": "Only sessions with (true) or without (false) in-progress or pending todos"
+                        },
+                        "registered": {
+                            "type": "boolean",
+                            "description": "Only sessions registered through register_session/heartbeat (true) or known from session files alone (false)"
+                        }
+                    }
+                }
+            }, {
+                "name": "stats",
+                "description": "Runtime metrics of the session monitor: tick durations, sessions scanned, parse failures, nudges sent and failed, and leader status. For diagnostics only.",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {}
+                }
+            }]
         }
 
+    @staticmethod
+    def parse_session_id(arguments: dict[str, JsonValue]) -> str:
+        """Validate the session_id argument of the session tools."""
+        session_id = arguments.get("session_id", "")
+
+        if not isinstance(session_id, str) or not session_id.strip():
+            raise ValueError("session_id must be a non-empty string")
+
+        return session_id
+
     def handle_tools_call(self, params: dict[str, JsonValue]) -> dict[str, JsonValue]:
         """Handle tools/call request - execute tool."""
         name_value = params.get("name", "")
@@ -613,7 +1777,63 @@ class PingPongMCPServer:
 
         name: str = name_value
 
-        raise ValueError(f"Unknown tool: {name}")
+        # Extract arguments from params
+        arguments = params.get("arguments", {})
+
+        if not isinstance(arguments, dict):
+            raise ValueError("Tool arguments must be an object")
+
+        if name == "register_session":
+            session_id = self.parse_session_id(arguments)
+            tmux_session = arguments.get("tmux_session")
+            session_type = arguments.get("session_type", "claude_code")
+
+            if tmux_session is not None and (not isinstance(tmux_session, str) or not tmux_session.strip()):
+                raise ValueError("tmux_session must be a non-empty string")
+
+            if not isinstance(session_type, str) or not session_type.strip():
+                raise ValueError("session_type must be a non-empty string")
+
+            result = self.monitor.register_session(session_id, tmux_session, session_type)
+        elif name == "heartbeat":
+            session_id = self.parse_session_id(arguments)
+            active_todo_count = arguments.get("active_todo_count")
+
+            if active_todo_count is not None and (not isinstance(active_todo_count, int) or isinstance(active_todo_count, bool) or active_todo_count < 0):
+                raise ValueError("active_todo_count must be a non-negative integer")
+
+            result = self.monitor.heartbeat(session_id, active_todo_count)
+        elif name == "mark_stale":
+            result = self.monitor.mark_stale(self.parse_session_id(arguments))
+        elif name == "list_sessions":
+            project = arguments.get("project")
+            status = arguments.get("status")
+
+            if project is not None and not isinstance(project, str):
+                raise ValueError("project must be a string")
+
+            if status is not None and status not in SessionMonitor.SESSION_STATUSES:
+                raise ValueError(f"status must be one of: {', '.join(SessionMonitor.SESSION_STATUSES)}")
+
+            flags: dict[str, bool | None] = {}
+            for flag in ("has_active_todos", "registered"):
+                value = arguments.get(flag)
+                if value is not None and not isinstance(value, bool):
+                    raise ValueError(f"{flag} must be a boolean")
+                flags[flag] = value
+
+            result = self.monitor.list_sessions(project, status, flags["has_active_todos"], flags["registered"])
+        elif name == "stats":
+            result = self.monitor.stats()
+        else:
+            raise ValueError(f"Unknown tool: {name}")
+
+        return {
+            "content": [{
+                "type": "text",
+                "text": json.dumps(result, indent=2, ensure_ascii=False)
+            }]
+        }
 
     def handle_request(self, request: dict[str, JsonValue]) -> dict[str, JsonValue]:
         """Handle incoming JSON-RPC request."""
@@ -689,23 +1909,25 @@ class PingPongMCPServer:
             return response
 
     def run(self) -> None:
-        """Run the MCP server - read from stdin, write to stdout."""
-        # Use line-buffered mode for stdio
-        sys.stdin.reconfigure(line_buffering=True)  # type: ignore[attr-defined]
-        sys.stdout.reconfigure(line_buffering=True)  # type: ignore[attr-defined]
+        """Run the MCP server - read frames from binary stdin, write to binary stdout."""
+        writer = transport.Writer()
 
-        logger.debug(f"Ping/Pong MCP server '{self.name}' starting...")
+        logger.debug("Ping/Pong MCP server '%s' starting...", self.name)
+
+        # Optional Prometheus textfile (RESIN_AI_METRICS_INTERVAL)
+        exporter = metrics.start_exporter(self.monitor.metrics, "ping-pong")
 
         try:
-            for line in sys.stdin:
-                line = line.strip()
-                if not line:
+            for line in transport.read_frames(sys.stdin.buffer):
+                if line is None:
+                    logger.debug("Discarded frame over %s bytes", transport.MAX_FRAME_BYTES)
+                    writer.send(transport.oversized_frame_error())
                     continue
 
-                logger.debug(f"Received: {line[:200]}{'...' if len(line) > 200 else ''}")
+                logger.debug("Received: %s", transport.Preview(line))
 
                 try:
-                    request = json.loads(line)
+                    request = transport.parse(line)
                     response = self.handle_request(request)
 
                     # Skip empty responses (notifications don't get responses)
@@ -713,16 +1935,12 @@ class PingPongMCPServer:
                         logger.debug("No response needed (notification)")
                         continue
 
-                    response_str = json.dumps(response)
-                    logger.debug(f"Sending: {response_str[:200]}{'...' if len(response_str) > 200 else ''}")
-
-                    # Write response as JSON line
-                    json.dump(response, sys.stdout)
-                    sys.stdout.write('\n')
-                    sys.stdout.flush()
+                    # Encoded once; the debug log decodes a preview only when enabled
+                    data = writer.send(response)
+                    logger.debug("Sending: %s", transport.Preview(data))
 
                 except json.JSONDecodeError as e:
-                    logger.debug(f"Parse error: {str(e)}")
+                    logger.debug("Parse error: %s", e)
 
                     error_response: dict[str, JsonValue] = {
                         "jsonrpc": "2.0",
@@ -731,20 +1949,20 @@ class PingPongMCPServer:
                             "message": f"Parse error: {str(e)}"
                         }
                     }
-                    json.dump(error_response, sys.stdout)
-                    sys.stdout.write('\n')
-                    sys.stdout.flush()
+                    writer.send(error_response)
 
         except KeyboardInterrupt:
             logger.info("Shutdown signal received")
         except Exception as e:
-            logger.debug(f"Fatal error: {e}")
+            logger.error("Fatal error: %s", e)
             import traceback
             traceback.print_exc(file=sys.stderr)
         finally:
             # Stop monitoring on shutdown
             self.monitor.stop_monitoring()
-            logger.debug(f"Ping/Pong MCP server '{self.name}' stopped.")
+            if exporter is not None:
+                exporter.stop()
+            logger.debug("Ping/Pong MCP server '%s' stopped.", self.name)
 
 
 def main() -> None:
@@ -7,23 +7,748 @@ Uses only Python standard library - no external dependencies required.
 
 Implements MCP (Model Context Protocol) JSON-RPC 2.0 over stdio.
 Resources accessible via plugin:orchestrator:resources://{path} URIs.
-Tools: read - reads file content from plugin resources directory.
+Tools: read - reads file content from plugin resources directory
+             (include_dependencies=true also returns every referenced resource;
+             section/heading_path and max_bytes return only part of a file).
+       read_many - reads several files in one round trip (per-file errors inline).
+       next_state - looks up the compiled STATE-MACHINE transition tables.
+       stats - request counts, latency histograms, cache hits, bytes served and
+               most-read files (metrics.py; RESIN_AI_METRICS_INTERVAL=N also writes a
+               Prometheus textfile under .sessions/).
+Resources: resources/list, resources/read (a URI ending in "/" returns every file
+below it) and resources/templates/list, served from a per-process manifest.
+Resources are indexed once at initialize (case-insensitive fallback, rescanned when
+a directory mtime changes) and repeat reads are served from a bounded in-memory LRU
+cache validated by mtime/size.
+
+Index, heading offsets, reference graph and content hashes persist in
+.resource-cache/bundle.bin so new sessions start warm (RESIN_AI_RESOURCE_BUNDLE=0 disables).
+
+Set RESIN_AI_RESOURCES_DAEMON=1 to share one daemon per host (Unix socket in
+.resource-cache/); the stdio process becomes a thin proxy and falls back to in-process
+serving while no daemon is running. `python3 resources.py --daemon` runs it directly.
+
+Set RESIN_AI_RESOURCES_WORKERS=N to serve tools/call and resources/read on N worker
+threads; responses are written as they complete and notifications/cancelled drops them.
+
+JSON-RPC framing (one compact UTF-8 line per message, bounded binary reads) is shared
+with ping-pong.py through transport.py. Logs go to stderr through tracing.py:
+RESIN_AI_DEBUG=1 enables DEBUG output and RESIN_AI_TRACE=N keeps the last N suppressed
+records for a dump on error.
 
 Requires Python 3.10+
 
-Updated: 2025-10-14 15:25:13 UTC
+Updated: 2026-10-18 22:36:12 UTC
 """
 
+import hashlib
 import json
+import logging
+import marshal
+import mmap
+import os
+import posixpath
+import re
+import socket
+import socketserver
+import subprocess
 import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Union
 
+import metrics
+import tracing
+import transport
+
 # Type alias for JSON-compatible values (Python 3.10+ compatible)
 JsonValue = Union[str, int, float, bool, None, dict[str, "JsonValue"], list["JsonValue"]]
 
 # Configuration
 RESOURCE_ROOT = Path.cwd() / 'resources'
+BUNDLE_PATH = Path.cwd() / '.resource-cache' / 'bundle.bin'
+BUNDLE_VERSION = 2  # bump when the bundle layout changes
+DAEMON_SOCKET_PATH = Path.cwd() / '.resource-cache' / 'resources.sock'
+DAEMON_IDLE_TIMEOUT = 900  # seconds without connections before the daemon exits
+RESOURCE_URI_PREFIX = "plugin:orchestrator:resources://"
+RESOURCE_MIME_TYPE = "text/markdown"
+REFERENCE_PATTERN = re.compile(r'plugin:orchestrator:resources://([\w./-]+\.md)')
+HEADING_PATTERN = re.compile(r'^(#{1,6})[ \t]+(.*?)[ \t#]*$')
+FENCE_PATTERN = re.compile(r'^[ ]{0,3}(`{3,}|~{3,})')
+TABLE_SEPARATOR_PATTERN = re.compile(r'^\|[\s:|-]+\|$')
+ORCHESTRATION_PREFIX = "STATE-MACHINE/ORCHESTRATION/"
+RETURN_CODES_KEY = "STATE-MACHINE/RETURN-CODES.md"
+CACHE_MAX_ENTRIES = 256  # resource files kept in memory (LRU)
+MANIFEST_PAGE_SIZE = 100  # resources per resources/list page
+CONCURRENT_METHODS = ("tools/call", "resources/read")  # dispatched to the worker pool in concurrent mode
+STATS_METHODS = ("initialize", "ping", "notifications/initialized", "notifications/cancelled", "tools/list", "tools/call", "resources/list", "resources/read", "resources/templates/list")  # per-method series in the stats tool (others count as "other")
+TOOL_NAMES = ("read", "read_many", "next_state", "stats")
+STATS_TOP_FILES = 10  # most-read files listed by the stats tool by default
+
+# Set RESIN_AI_RESOURCE_BUNDLE=0 to disable the on-disk bundle (always walk and scan at startup)
+BUNDLE_ENABLED = os.environ.get('RESIN_AI_RESOURCE_BUNDLE', '1') != '0'
+
+# Concurrent mode: RESIN_AI_RESOURCES_WORKERS=N serves requests on N worker threads (0 = sequential)
+WORKERS = int(os.environ.get('RESIN_AI_RESOURCES_WORKERS', '0') or 0)
+
+# Daemon mode: RESIN_AI_RESOURCES_DAEMON=1 proxies stdio to a shared per-host daemon (started on demand)
+DAEMON_MODE = os.environ.get('RESIN_AI_RESOURCES_DAEMON') == '1'
+
+# Logging to stderr (RESIN_AI_DEBUG=1 for DEBUG level, RESIN_AI_TRACE=N for an error-triggered ring buffer)
+logger = tracing.get_logger('resources')
+
+
+class ResourceCache:
+    """Bounded LRU cache of resource contents validated by (st_mtime_ns, st_size)."""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self.entries: OrderedDict[Path, tuple[tuple[int, int], str]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def read(self, path: Path) -> str:
+        """Return file content, re-reading from disk only when the file changed."""
+        return self.load(path)[1]
+
+    def load(self, path: Path) -> tuple[tuple[int, int], str]:
+        """Return (stamp, content) for a file, re-reading from disk only when it changed."""
+        # Single stat validates the cached copy (raises FileNotFoundError if gone)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            with self._lock:
+                self.entries.pop(path, None)
+            raise
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self.entries.get(path)
+            if entry is not None and entry[0] == stamp:
+                self.entries.move_to_end(path)
+                self.hits += 1
+                return entry
+
+            self.misses += 1
+
+        # Read outside the lock so a slow file does not block other readers
+        content = path.read_text(encoding='utf-8')
+
+        # Store with the pre-read stamp so a concurrent write is picked up next time
+        entry = (stamp, content)
+
+        with self._lock:
+            self.entries[path] = entry
+            self.entries.move_to_end(path)
+
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+        return entry
+
+    def stats(self) -> dict[str, JsonValue]:
+        """Return cache counters."""
+        return {
+            "entries": len(self.entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+class ResourceIndex:
+    """In-memory index of Markdown resources keyed by normalized relative path."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.files: dict[str, Path] = {}  # exact relative path -> file
+        self.folded: dict[str, str] = {}  # casefolded relative path -> exact relative path
+        self.dir_mtimes: dict[str, int] = {}  # directory -> st_mtime_ns
+        self.built = False
+        self.generation = 0  # bumped on every rebuild
+        self._lock = threading.Lock()
+
+    def build(self) -> None:
+        """Walk the resource root once and (re)build the index."""
+        with self._lock:
+            self._build()
+
+    def _build(self) -> None:
+        files: dict[str, Path] = {}
+        folded: dict[str, str] = {}
+        dir_mtimes: dict[str, int] = {}
+
+        # Symlinks are skipped so every indexed file lives inside the root
+        pending: list[tuple[str, str]] = [(str(self.root), "")]
+        while pending:
+            directory, prefix = pending.pop()
+            try:
+                dir_mtimes[directory] = os.stat(directory).st_mtime_ns
+                entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+            except OSError:
+                continue
+
+            for entry in entries:
+                key = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((entry.path, key + "/"))
+                elif entry.is_file(follow_symlinks=False) and entry.name.endswith('.md'):
+                    files[key] = Path(entry.path)
+                    folded.setdefault(key.casefold(), key)
+
+        self.files = files
+        self.folded = folded
+        self.dir_mtimes = dir_mtimes
+        self.built = True
+        self.generation += 1
+
+    def restore(self, keys: list[str], dir_mtimes: dict[str, int]) -> None:
+        """Adopt a previously built index (e.g. from the on-disk bundle) without walking."""
+        with self._lock:
+            self.files = {key: self.root / key for key in keys}
+            self.folded = {}
+            for key in sorted(keys):
+                self.folded.setdefault(key.casefold(), key)
+            self.dir_mtimes = dict(dir_mtimes)
+            self.built = True
+            self.generation += 1
+
+    def refresh(self) -> bool:
+        """Rebuild the index if any indexed directory changed. Returns True if rebuilt."""
+        with self._lock:
+            return self._refresh()
+
+    def _refresh(self) -> bool:
+        if self.built:
+            for directory, mtime_ns in self.dir_mtimes.items():
+                try:
+                    if os.stat(directory).st_mtime_ns != mtime_ns:
+                        break
+                except OSError:
+                    break
+            else:
+                return False
+
+        self._build()
+        return True
+
+    @staticmethod
+    def normalize(file_path: str) -> str:
+        """Convert a file path or plugin:orchestrator:resources:// URI to an index key."""
+        if file_path.startswith(RESOURCE_URI_PREFIX):
+            file_path = file_path[len(RESOURCE_URI_PREFIX):]
+
+        return posixpath.normpath(file_path.replace('\\', '/').lstrip('/'))
+
+    def canonical(self, key: str) -> str | None:
+        """Find the indexed key for a key by exact match, falling back to a case-insensitive match."""
+        if not self.built:
+            self.build()
+
+        if key in self.files:
+            return key
+
+        return self.folded.get(key.casefold())
+
+
+class ReferenceGraph:
+    """Graph of plugin:orchestrator:resources:// references between resources.
+
+    Edges are stored per file with the (st_mtime_ns, st_size) stamp they were
+    scanned at, so a changed file is rescanned on its own the next time it is
+    visited. Targets are kept as raw keys and resolved through the index at
+    traversal time, so added or removed files need no graph rebuild.
+    """
+
+    def __init__(self, index: ResourceIndex, cache: ResourceCache) -> None:
+        self.index = index
+        self.cache = cache
+        self.edges: dict[str, tuple[tuple[int, int], list[str]]] = {}
+
+    def build(self) -> None:
+        """Scan every indexed file for references."""
+        for key in list(self.index.files):
+            try:
+                self.references(key)
+            except (OSError, UnicodeDecodeError):
+                continue
+
+    def references(self, key: str) -> list[str]:
+        """Return keys referenced by an indexed file, rescanning it only if it changed."""
+        stamp, content = self.cache.load(self.index.files[key])
+
+        entry = self.edges.get(key)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+
+        targets: list[str] = []
+        for match in REFERENCE_PATTERN.finditer(content):
+            target = ResourceIndex.normalize(match.group(1))
+            if target != key and target not in targets:
+                targets.append(target)
+
+        self.edges[key] = (stamp, targets)
+        return targets
+
+    def closure(self, key: str) -> list[str]:
+        """Return key plus everything it transitively references, each file before the files it references."""
+        postorder: list[str] = []
+        visited: set[str] = set()
+
+        def visit(node: str) -> None:
+            visited.add(node)
+            try:
+                targets = self.references(node)
+            except FileNotFoundError:
+                return
+
+            for target in targets:
+                resolved = self.index.canonical(target)
+                if resolved is not None and resolved not in visited:
+                    visit(resolved)
+
+            postorder.append(node)
+
+        visit(key)
+
+        # Reverse postorder is a topological order (cycles are broken at the back edge)
+        postorder.reverse()
+        return postorder
+
+
+class SectionIndex:
+    """Per-file Markdown heading offsets, recomputed only when the file changes.
+
+    Each heading is stored as (level, title, start, end) where start/end are
+    offsets into the cached content and the section runs until the next
+    heading of the same or higher level.
+    """
+
+    def __init__(self, index: ResourceIndex, cache: ResourceCache) -> None:
+        self.index = index
+        self.cache = cache
+        self.headings: dict[str, tuple[tuple[int, int], list[tuple[int, str, int, int]]]] = {}
+
+    @staticmethod
+    def parse(content: str) -> list[tuple[int, str, int, int]]:
+        """Return (level, title, start, end) for every ATX heading outside fenced code blocks."""
+        found: list[tuple[int, str, int]] = []
+        fence: str | None = None
+        offset = 0
+
+        for line in content.splitlines(keepends=True):
+            stripped = line.rstrip('\r\n')
+
+            fence_match = FENCE_PATTERN.match(stripped)
+            if fence_match:
+                marker = fence_match.group(1)
+                if fence is None:
+                    fence = marker[0] * 3
+                elif marker.startswith(fence):
+                    fence = None
+            elif fence is None:
+                heading_match = HEADING_PATTERN.match(stripped)
+                if heading_match:
+                    found.append((len(heading_match.group(1)), heading_match.group(2), offset))
+
+            offset += len(line)
+
+        headings: list[tuple[int, str, int, int]] = []
+        for position, (level, title, start) in enumerate(found):
+            end = len(content)
+            for next_level, _, next_start in found[position + 1:]:
+                if next_level <= level:
+                    end = next_start
+                    break
+            headings.append((level, title, start, end))
+
+        return headings
+
+    def build(self) -> None:
+        """Parse headings of every indexed file."""
+        for key in list(self.index.files):
+            try:
+                self.load(key)
+            except (OSError, UnicodeDecodeError):
+                continue
+
+    def load(self, key: str) -> tuple[str, list[tuple[int, str, int, int]]]:
+        """Return (content, headings) for an indexed file, reparsing only if it changed."""
+        stamp, content = self.cache.load(self.index.files[key])
+
+        entry = self.headings.get(key)
+        if entry is None or entry[0] != stamp:
+            entry = (stamp, self.parse(content))
+            self.headings[key] = entry
+
+        return content, entry[1]
+
+    def extract(self, key: str, heading_path: list[str]) -> str:
+        """Return the section whose heading matches the last path element.
+
+        Earlier path elements must match enclosing headings, in order (gaps allowed).
+        Matching is case-insensitive and ignores surrounding whitespace.
+        """
+        content, headings = self.load(key)
+        wanted = [part.strip().lstrip('#').strip().casefold() for part in heading_path]
+
+        ancestors: list[tuple[int, str]] = []
+        for level, title, start, end in headings:
+            while ancestors and ancestors[-1][0] >= level:
+                ancestors.pop()
+
+            if title.casefold() == wanted[-1]:
+                remaining = iter(ancestor_title for _, ancestor_title in ancestors)
+                if all(any(part == ancestor for ancestor in remaining) for part in wanted[:-1]):
+                    return content[start:end]
+
+            ancestors.append((level, title.casefold()))
+
+        available = ", ".join(title for _, title, _, _ in headings)
+        raise ValueError(f"Section not found: {' > '.join(heading_path)} (available: {available})")
+
+
+class StateMachine:
+    """Transition graph compiled from the STATE-MACHINE Markdown tables.
+
+    Sources are the CONTROLLER / STATE TRANSITIONS / Loop Controller Logic
+    tables of every STATE-MACHINE/ORCHESTRATION/*.md file plus the State
+    Transition Mapping of RETURN-CODES.md. The graph is recompiled only when
+    one of those files (or the index) changes.
+    """
+
+    def __init__(self, index: ResourceIndex, sections: SectionIndex) -> None:
+        self.index = index
+        self.sections = sections
+        self.stamps: dict[str, tuple[int, int]] = {}
+        self.generation = -1
+        # (STATE, CODE) -> transition rows, across all orchestrations
+        self.transitions: dict[tuple[str, str], list[dict[str, JsonValue]]] = {}
+        # STATE -> outgoing transition rows
+        self.outgoing: dict[str, list[dict[str, JsonValue]]] = {}
+        # (BASE_STATE, RETURN_CODE) -> next state action (e.g. ("TEST", "FAILURE"))
+        self.return_codes: dict[tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def parse_tables(text: str) -> list[list[dict[str, str]]]:
+        """Parse every pipe table in text into rows keyed by header cell."""
+        tables: list[list[dict[str, str]]] = []
+        header: list[str] | None = None
+
+        for line in text.splitlines():
+            line = line.strip()
+
+            if not line.startswith('|'):
+                header = None
+                continue
+
+            if TABLE_SEPARATOR_PATTERN.match(line):
+                continue
+
+            cells = [cell.strip() for cell in line.strip('|').split('|')]
+
+            if header is None:
+                header = cells
+                tables.append([])
+            else:
+                tables[-1].append(dict(zip(header, cells)))
+
+        return tables
+
+    @staticmethod
+    def clean(value: str) -> str | None:
+        """Normalize a table cell ('-' means empty, leading → markers are nesting only)."""
+        value = value.strip().lstrip('→ ').strip()
+        return None if value in ('', '-') else value
+
+    def _sources(self) -> dict[str, tuple[int, int]]:
+        """Stat the source files (one stat each)."""
+        stamps: dict[str, tuple[int, int]] = {}
+        for key, path in self.index.files.items():
+            if key.startswith(ORCHESTRATION_PREFIX) or key == RETURN_CODES_KEY:
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                stamps[key] = (stat.st_mtime_ns, stat.st_size)
+        return stamps
+
+    def ensure_compiled(self) -> None:
+        """Recompile the graph if any source changed since the last compile."""
+        if not self.index.built:
+            self.index.build()
+
+        with self._lock:
+            stamps = self._sources()
+            if stamps != self.stamps or self.generation != self.index.generation:
+                self.compile(sorted(stamps))
+                self.stamps = stamps
+                self.generation = self.index.generation
+
+    def compile(self, keys: list[str]) -> None:
+        """Parse the source tables into lookup dictionaries."""
+        transitions: dict[tuple[str, str], list[dict[str, JsonValue]]] = {}
+        outgoing: dict[str, list[dict[str, JsonValue]]] = {}
+        return_codes: dict[tuple[str, str], str] = {}
+
+        for key in keys:
+            content, headings = self.sections.load(key)
+
+            if key == RETURN_CODES_KEY:
+                for level, title, start, end in headings:
+                    if title.casefold() != "state transition mapping":
+                        continue
+                    for table in self.parse_tables(content[start:end]):
+                        for row in table:
+                            state = self.clean(row.get("Current State", ""))
+                            code = self.clean(row.get("Return Code", ""))
+                            action = self.clean(row.get("Next State Action", ""))
+                            if state and code and action:
+                                return_codes[(state.upper(), code.upper())] = action
+                continue
+
+            orchestration = posixpath.splitext(posixpath.basename(key))[0]
+            controller: dict[str, dict[str, str | None]] = {}
+            loop_logic: dict[str, str] = {}
+            rows: list[dict[str, str]] = []
+
+            # Headings nest, so only take tables from the innermost section of each span
+            for level, title, start, end in headings:
+                section_end = end
+                for _, _, child_start, _ in headings:
+                    if start < child_start < section_end:
+                        section_end = child_start
+                        break
+
+                for table in self.parse_tables(content[start:section_end]):
+                    for row in table:
+                        if "Transition State" in row and "Code" in row:
+                            rows.append(row)
+                        elif "Phase Name (with Loop Indicators)" in row:
+                            state = self.clean(row.get("State Name", ""))
+                            if state:
+                                controller[state.upper()] = {
+                                    "phase_name": self.clean(row.get("Phase Name (with Loop Indicators)", "")),
+                                    "suitable_agent": self.clean(row.get("Suitable Agent (or fallback to General Purpose)", "")),
+                                    "quality_standards": self.clean(row.get("Quality Standards", ""))
+                                }
+                        elif "Controller Name" in row:
+                            state = self.clean(row.get("Controller Name", ""))
+                            logic = self.clean(row.get("Decision Logic", ""))
+                            if state and logic:
+                                loop_logic[state.upper()] = logic
+
+            for row in rows:
+                state = self.clean(row.get("State Name", ""))
+                next_state = self.clean(row.get("Transition State", ""))
+                code = self.clean(row.get("Code", ""))
+                if not state or not next_state or not code:
+                    continue
+
+                state, next_state, code = state.upper(), next_state.upper(), code.upper()
+                target = controller.get(next_state, {})
+
+                transition: dict[str, JsonValue] = {
+                    "orchestration": orchestration,
+                    "source": RESOURCE_URI_PREFIX + key,
+                    "state": state,
+                    "code": code,
+                    "next_state": next_state,
+                    "description": self.clean(row.get("Description", "")),
+                    "phase_name": target.get("phase_name"),
+                    "suitable_agent": target.get("suitable_agent"),
+                    "quality_standards": target.get("quality_standards")
+                }
+                if next_state in loop_logic:
+                    transition["controller_logic"] = loop_logic[next_state]
+
+                transitions.setdefault((state, code), []).append(transition)
+                outgoing.setdefault(state, []).append(transition)
+
+        self.transitions = transitions
+        self.outgoing = outgoing
+        self.return_codes = return_codes
+
+    def next_state(self, state: str, code: str | None = None, orchestration: str | None = None) -> dict[str, JsonValue]:
+        """Look up the transitions leaving state (optionally for one code and orchestration)."""
+        self.ensure_compiled()
+
+        state = state.strip().upper()
+
+        if state not in self.outgoing:
+            known = ", ".join(sorted(self.outgoing))
+            raise ValueError(f"Unknown state: {state} (known: {known})")
+
+        if code is not None:
+            code = code.strip().upper()
+            rows = self.transitions.get((state, code), [])
+        else:
+            rows = self.outgoing[state]
+
+        if orchestration is not None:
+            orchestration = orchestration.strip().upper()
+            rows = [row for row in rows if row["orchestration"] == orchestration]
+
+        result: dict[str, JsonValue] = {
+            "state": state,
+            "code": code,
+            "transitions": list(rows)
+        }
+
+        # Standard return codes map onto the base state (TASK_TEST -> TEST)
+        if code is not None:
+            action = self.return_codes.get((state.rsplit('_', 1)[-1], code))
+            if action is not None:
+                result["return_code_action"] = action
+
+        return result
+
+
+class ResourceManifest:
+    """Per-process manifest of indexed resources (URI, size, mtime, content hash)."""
+
+    def __init__(self, index: ResourceIndex, cache: ResourceCache) -> None:
+        self.index = index
+        self.cache = cache
+        self.entries: dict[str, tuple[tuple[int, int], dict[str, JsonValue]]] = {}
+        self.keys: list[str] = []
+        self.generation = -1
+        self._lock = threading.Lock()
+
+    def _describe(self, key: str, path: Path, stamp: tuple[int, int]) -> dict[str, JsonValue]:
+        """Hash one file and build its MCP resource descriptor."""
+        content = self.cache.read(path)
+        return self.descriptor(key, stamp, hashlib.sha256(content.encode('utf-8')).hexdigest())
+
+    @staticmethod
+    def descriptor(key: str, stamp: tuple[int, int], digest: str) -> dict[str, JsonValue]:
+        """Build the MCP resource descriptor for one file from its stamp and content hash."""
+        modified = datetime.fromtimestamp(stamp[0] / 1_000_000_000, tz=timezone.utc)
+
+        return {
+            "uri": RESOURCE_URI_PREFIX + key,
+            "name": key,
+            "mimeType": RESOURCE_MIME_TYPE,
+            "size": stamp[1],
+            "annotations": {
+                "lastModified": modified.isoformat().replace("+00:00", "Z")
+            },
+            "_meta": {
+                "sha256": digest
+            }
+        }
+
+    def resources(self) -> list[dict[str, JsonValue]]:
+        """Return descriptors for all resources, rehashing only files that changed."""
+        with self._lock:
+            return self._resources()
+
+    def _resources(self) -> list[dict[str, JsonValue]]:
+        self.index.refresh()
+
+        # Index rebuilt: drop descriptors for files that no longer exist
+        if self.generation != self.index.generation:
+            self.keys = sorted(self.index.files)
+            self.entries = {key: self.entries[key] for key in self.keys if key in self.entries}
+            self.generation = self.index.generation
+
+        descriptors: list[dict[str, JsonValue]] = []
+        for key in self.keys:
+            path = self.index.files[key]
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            entry = self.entries.get(key)
+            if entry is None or entry[0] != stamp:
+                entry = (stamp, self._describe(key, path, stamp))
+                self.entries[key] = entry
+
+            descriptors.append(entry[1])
+
+        return descriptors
+
+
+class ResourceBundle:
+    """Persistent snapshot of the index and per-file derived data shared across sessions.
+
+    Stored with marshal at BUNDLE_PATH and memory-mapped on load. The full list
+    of indexed keys is kept apart from the per-file derived data, so a file whose
+    derived data was stale at save time is still indexed. The bundle is trusted
+    only if every indexed directory still has its recorded mtime; per-file entries
+    carry their (st_mtime_ns, st_size) stamp and entries whose file changed since
+    (e.g. edited in place) are dropped on load and rebuilt lazily. Writes go
+    through a temp file and os.replace so concurrent sessions never see a partial
+    bundle.
+    """
+
+    def __init__(self, path: Path, root: Path) -> None:
+        self.path = path
+        self.root = root
+
+    def load(self) -> dict[str, object] | None:
+        """Return the bundle contents if present and still valid for the tree."""
+        try:
+            with open(self.path, 'rb') as handle:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    data = marshal.loads(mapped)
+        except (OSError, ValueError, EOFError, TypeError):
+            return None
+
+        if not isinstance(data, dict) or data.get("version") != BUNDLE_VERSION or data.get("root") != str(self.root):
+            return None
+
+        dir_mtimes = data.get("dir_mtimes")
+        keys = data.get("keys")
+        entries = data.get("entries")
+        if not isinstance(dir_mtimes, dict) or not isinstance(keys, list) or not isinstance(entries, dict):
+            return None
+
+        # Any added, removed or renamed file changes its directory mtime
+        for directory, mtime_ns in dir_mtimes.items():
+            try:
+                if os.stat(directory).st_mtime_ns != mtime_ns:
+                    return None
+            except OSError:
+                return None
+
+        # In-place edits leave directory mtimes alone; keep only entries whose file is unchanged
+        fresh: dict[str, object] = {}
+        for key, entry in entries.items():
+            try:
+                stat = os.stat(self.root / key)
+            except OSError:
+                continue
+            if isinstance(entry, tuple) and entry and entry[0] == (stat.st_mtime_ns, stat.st_size):
+                fresh[key] = entry
+
+        return {**data, "entries": fresh}
+
+    def save(self, data: dict[str, object]) -> bool:
+        """Atomically write the bundle. Returns False if the cache directory is not writable."""
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_bytes(marshal.dumps(data))
+            os.replace(temp_path, self.path)
+        except OSError:
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+            return False
+
+        return True
 
 
 class MCPServer:
@@ -32,13 +757,40 @@ class MCPServer:
     def __init__(self, name: str, version: str = "1.0.0") -> None:
         self.name = name
         self.version = version
+        self.cache = ResourceCache()
+        self.index = ResourceIndex(RESOURCE_ROOT)
+        self.manifest = ResourceManifest(self.index, self.cache)
+        self.graph = ReferenceGraph(self.index, self.cache)
+        self.sections = SectionIndex(self.index, self.cache)
+        self.state_machine = StateMachine(self.index, self.sections)
+        self.bundle = ResourceBundle(BUNDLE_PATH, RESOURCE_ROOT)
+        self.bundle_snapshot: dict[str, object] | None = None
+        self.in_flight: dict[str | int, Future[dict[str, JsonValue]]] = {}
+        self.cancelled: set[str | int] = set()
+        self._in_flight_lock = threading.Lock()
+        self.writer = transport.Writer()
+        self.mode = "stdio"  # "daemon" when serving proxied sessions
+        self.metrics = metrics.Metrics("resin_ai_resources", {
+            "errors_total": "method",
+            "request_duration_ms": "method",
+            "file_reads_total": "file"
+        })
+        self.metrics.collector(self.collect_metrics)
 
     def handle_initialize(self, _: dict[str, JsonValue]) -> dict[str, JsonValue]:
         """Handle initialize request."""
+        # Index resources once up front so reads are plain dict lookups. The daemon
+        # warm-starts before it listens; rerunning it per proxied session would swap
+        # shared structures under other sessions' readers (and could seed them from
+        # an older bundle), so an already built index is left alone.
+        if not self.index.built:
+            self.warm_start()
+
         return {
             "protocolVersion": "2025-06-18",
             "capabilities": {
-                "tools": {}
+                "tools": {},
+                "resources": {}
             },
             "serverInfo": {
                 "name": self.name,
@@ -46,31 +798,141 @@ class MCPServer:
             }
         }
 
+    def warm_start(self) -> None:
+        """Seed index and derived data from the on-disk bundle, or build them and persist a new bundle."""
+        data = self.bundle.load() if BUNDLE_ENABLED else None
+
+        if data is not None:
+            keys = data["keys"]
+            entries = data["entries"]
+            assert isinstance(keys, list) and isinstance(entries, dict)
+
+            self.index.restore(keys, data["dir_mtimes"])  # type: ignore[arg-type]
+            for key, (stamp, references, headings, digest) in entries.items():
+                self.graph.edges[key] = (stamp, references)
+                self.sections.headings[key] = (stamp, headings)
+                self.manifest.entries[key] = (stamp, ResourceManifest.descriptor(key, stamp, digest))
+
+            self.bundle_snapshot = data
+            logger.debug("Loaded resource bundle: %s files (%s with derived data)", len(keys), len(entries))
+            return
+
+        # Cold start: walk, scan and hash everything once
+        self.index.build()
+        self.graph.build()
+        self.sections.build()
+        self.manifest.resources()
+        self.persist()
+
+    def snapshot(self) -> dict[str, object]:
+        """Collect every indexed key plus the per-file derived data that agree on the same file stamp.
+
+        Files whose derived data disagree (changed since one of them was built)
+        stay indexed; only their derived data is left out.
+        """
+        entries: dict[str, tuple[tuple[int, int], list[str], list[tuple[int, str, int, int]], str]] = {}
+
+        for key in self.index.files:
+            edges = self.graph.edges.get(key)
+            headings = self.sections.headings.get(key)
+            manifest_entry = self.manifest.entries.get(key)
+            if edges is None or headings is None or manifest_entry is None:
+                continue
+
+            stamp = edges[0]
+            if headings[0] != stamp or manifest_entry[0] != stamp:
+                continue
+
+            meta = manifest_entry[1]["_meta"]
+            assert isinstance(meta, dict)
+            entries[key] = (stamp, edges[1], headings[1], str(meta["sha256"]))
+
+        return {
+            "version": BUNDLE_VERSION,
+            "root": str(RESOURCE_ROOT),
+            "dir_mtimes": dict(self.index.dir_mtimes),
+            "keys": sorted(self.index.files),
+            "entries": entries
+        }
+
+    def persist(self) -> None:
+        """Write the bundle if its contents changed since it was loaded or last written."""
+        if not BUNDLE_ENABLED or not self.index.built:
+            return
+
+        data = self.snapshot()
+        if data == self.bundle_snapshot:
+            return
+
+        if self.bundle.save(data):
+            self.bundle_snapshot = data
+            logger.debug("Saved resource bundle: %s files", len(data['entries']))  # type: ignore[arg-type]
+
     def handle_noop(self) -> dict[str, JsonValue]:
         """Handle unsupported requests."""
         return {}
 
-    def read_file(self, file_path: str) -> str:
-        """Read file content from file path or plugin:orchestrator:resources:// URI."""
-        # Remove "plugin:orchestrator:resources://" prefix
-        file_path = file_path.replace("plugin:orchestrator:resources://", "")
+    def handle_cancelled(self, params: dict[str, JsonValue]) -> dict[str, JsonValue]:
+        """Handle notifications/cancelled - drop the in-flight request so no response is sent."""
+        request_id = params.get("requestId")
 
-        resource_path = (RESOURCE_ROOT / file_path).resolve()
+        if not isinstance(request_id, (str, int)):
+            return {}
 
-        # Security: Prevent directory traversal
-        if not resource_path.is_relative_to(RESOURCE_ROOT.resolve()):
-            raise ValueError(f"Access denied: path outside resource root: {file_path}")
+        with self._in_flight_lock:
+            future = self.in_flight.get(request_id)
+            if future is not None:
+                self.cancelled.add(request_id)
 
-        # Check file exists
-        if not resource_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+        # Queued work never starts; running work finishes but its response is discarded
+        # (cancel() runs the done callback inline, so it must happen outside the lock)
+        if future is not None:
+            future.cancel()
+
+        return {}
+
+    def resolve(self, file_path: str) -> tuple[str, Path]:
+        """Resolve a file path or URI to its index key and file via the resource index."""
+        key = ResourceIndex.normalize(file_path)
+
+        # Security: Prevent directory traversal (only indexed files are ever served)
+        if key == '..' or key.startswith('../'):
+            raise ValueError(f"Access denied: path outside resource root: {file_path}")
 
         # Validate file is Markdown
-        if resource_path.suffix != '.md':
+        if not key.endswith('.md'):
             raise ValueError(f"Only Markdown files (.md) are supported: {file_path}")
 
-        # Read and return file content
-        return resource_path.read_text(encoding='utf-8')
+        canonical_key = self.index.canonical(key)
+
+        # Unknown path: rescan only if the tree changed since the last walk
+        if canonical_key is None and self.index.refresh():
+            canonical_key = self.index.canonical(key)
+
+        if canonical_key is None:
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        return canonical_key, self.index.files[canonical_key]
+
+    def read_file(self, file_path: str) -> str:
+        """Read file content from file path or plugin:orchestrator:resources:// URI."""
+        key, resource_path = self.resolve(file_path)
+        self.metrics.inc("file_reads_total", key)
+
+        # Read file content (cache stat doubles as the existence check)
+        try:
+            return self.cache.read(resource_path)
+        except FileNotFoundError:
+            pass
+
+        # Indexed file vanished: rescan and retry once
+        self.index.refresh()
+        _, resource_path = self.resolve(file_path)
+
+        try:
+            return self.cache.read(resource_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
 
     def handle_tools_list(self, _: dict[str, JsonValue]) -> dict[str, JsonValue]:
         """Handle tools/list request - list available tools."""
@@ -84,13 +946,209 @@ class MCPServer:
                         "file_path": {
                             "type": "string",
                             "description": "Path to the file to read (relative to resources directory)"
+                        },
+                        "include_dependencies": {
+                            "type": "boolean",
+                            "description": "Also return every resource the file references, transitively (each file before the files it references). Cannot be combined with `section` or `heading_path`; `max_bytes` then limits all returned blocks together"
+                        },
+                        "section": {
+                            "type": "string",
+                            "description": "Return only the section under this heading (case-insensitive, e.g. `STATE TRANSITIONS`)"
+                        },
+                        "heading_path": {
+                            "type": "array",
+                            "items": {
+                                "type": "string"
+                            },
+                            "description": "Return only the section at this heading path, outermost first (e.g. [`TASK ORCHESTRATION`, `STATE TRANSITIONS`])"
+                        },
+                        "max_bytes": {
+                            "type": "integer",
+                            "minimum": 1,
+                            "description": "Truncate the returned text to at most this many UTF-8 bytes (with `include_dependencies`: a budget shared by all blocks, files past it are listed but not returned)"
                         }
                     },
                     "required": ["file_path"]
                 }
+            }, {
+                "name": "read_many",
+                "description": "Read several `plugin:orchestrator:resources://` files in one call. **SHOULD** be used instead of repeated `read` calls when multiple files are needed. Each file is returned as a separate block headed by its URI; per-file errors are reported inline.",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "file_paths": {
+                            "type": "array",
+                            "items": {
+                                "type": "string"
+                            },
+                            "description": "Paths of the files to read (relative to resources directory)"
+                        }
+                    },
+                    "required": ["file_paths"]
+                }
+            }, {
+                "name": "next_state",
+                "description": "Look up the orchestration state machine: given the current state (e.g. `TASK_TEST`) and a transition or return code (e.g. `RETRY`, `FAILURE`), returns the next state, its phase name template and suitable agent. **SHOULD** be used instead of re-reading `STATE-MACHINE` tables.",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "state": {
+                            "type": "string",
+                            "description": "Current state name (e.g. `TASK_TEST`)"
+                        },
+                        "code": {
+                            "type": "string",
+                            "description": "Transition code (CONTINUE, RETRY, LOOP, EXIT, ERROR) or return code (SUCCESS, FAILURE, PARTIAL, TIMEOUT, MISSING); omit to list all transitions from the state"
+                        },
+                        "orchestration": {
+                            "type": "string",
+                            "description": "Limit to one orchestration level (TASK, STORY, EPIC, PROJECT, PLANNING)"
+                        }
+                    },
+                    "required": ["state"]
+                }
+            }, {
+                "name": "stats",
+                "description": "Runtime metrics of this resources server: request counts, errors and latency histograms per method, cache hits, bytes served and the most-read files. For diagnostics only.",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "top": {
+                            "type": "integer",
+                            "minimum": 1,
+                            "description": f"Number of most-read files to list (default {STATS_TOP_FILES})"
+                        }
+                    }
+                }
             }]
         }
 
+    def read_tool_text(self, file_path: str) -> str:
+        """Return the text served by the read tools for a path (file content or CLAUDE_PLUGIN_ROOT)."""
+        # Handle CLAUDE_PLUGIN_ROOT special case
+        if file_path == "CLAUDE_PLUGIN_ROOT":
+            return str(Path.cwd())
+
+        return self.read_file(file_path)
+
+    def read_with_dependencies(self, file_path: str, max_bytes: int | None = None) -> list[JsonValue]:
+        """Read a file plus its transitive references, one text block per file headed by its URI.
+
+        max_bytes is a budget for all blocks together, markers and notes
+        included: the block that crosses it is truncated (leaving room for a
+        count of the files after it) and the files after it are only listed.
+        """
+        key, _ = self.resolve(file_path)
+        closure = self.graph.closure(key)
+        remaining = max_bytes
+
+        blocks: list[JsonValue] = []
+        for position, dependency in enumerate(closure):
+            try:
+                text = self.read_file(dependency)
+            except FileNotFoundError as e:
+                text = f"Error: {e}"
+
+            text = f"<!-- {RESOURCE_URI_PREFIX}{dependency} -->\n{text}"
+
+            if remaining is not None:
+                rest = closure[position + 1:]
+                reserve = len(self.omitted_count_note(len(rest))) if rest else 0
+                size = len(text.encode('utf-8'))
+
+                if size + reserve > remaining:
+                    # Budget reached: cut this block short, or drop it if only the note fits
+                    if remaining - reserve > 0:
+                        text = self.truncate(text, remaining - reserve)
+                        remaining -= len(text.encode('utf-8'))
+                        blocks.append({
+                            "type": "text",
+                            "text": text
+                        })
+                    else:
+                        rest = closure[position:]
+
+                    note = self.omitted_note(rest, remaining)
+                    if note:
+                        blocks.append({
+                            "type": "text",
+                            "text": note
+                        })
+                    break
+
+                remaining -= size
+
+            blocks.append({
+                "type": "text",
+                "text": text
+            })
+
+        return blocks
+
+    @staticmethod
+    def omitted_count_note(count: int) -> str:
+        """Short note for files left out of a budgeted dependency read."""
+        return f"<!-- max_bytes reached, {count} files not included -->"
+
+    @classmethod
+    def omitted_note(cls, keys: list[str], max_bytes: int) -> str:
+        """Note for files left out of a budgeted read: their URIs, else their count, else nothing if neither fits."""
+        if not keys:
+            return ""
+
+        listed = f"<!-- max_bytes reached, not included: {', '.join(RESOURCE_URI_PREFIX + key for key in keys)} -->"
+        if len(listed.encode('utf-8')) <= max_bytes:
+            return listed
+
+        counted = cls.omitted_count_note(len(keys))
+        return counted if len(counted) <= max_bytes else ""
+
+    @staticmethod
+    def parse_heading_path(arguments: dict[str, JsonValue]) -> list[str]:
+        """Return the requested heading path from `section` or `heading_path` (empty for the whole file)."""
+        section = arguments.get("section")
+        heading_path_value = arguments.get("heading_path")
+
+        if section is not None and heading_path_value is not None:
+            raise ValueError("Use either section or heading_path, not both")
+
+        if section is not None:
+            if not isinstance(section, str) or not section.strip():
+                raise ValueError("section must be a non-empty string")
+            return [section]
+
+        if heading_path_value is not None:
+            if not isinstance(heading_path_value, list) or not heading_path_value:
+                raise ValueError("heading_path must be a non-empty array of strings")
+
+            heading_path: list[str] = [item for item in heading_path_value if isinstance(item, str)]
+
+            if len(heading_path) != len(heading_path_value):
+                raise ValueError("heading_path must be a non-empty array of strings")
+            return heading_path
+
+        return []
+
+    @staticmethod
+    def truncate(content: str, max_bytes: int) -> str:
+        """Cut content to at most max_bytes of UTF-8 without splitting a character.
+
+        The truncation marker counts against max_bytes; if it does not fit, only
+        the cut content is returned.
+        """
+        data = content.encode('utf-8')
+
+        if len(data) <= max_bytes:
+            return content
+
+        marker = f"\n<!-- truncated at {max_bytes} of {len(data)} bytes -->"
+        room = max_bytes - len(marker.encode('utf-8'))
+
+        if room <= 0:
+            return data[:max_bytes].decode('utf-8', errors='ignore')
+
+        return data[:room].decode('utf-8', errors='ignore') + marker
+
     def handle_tools_call(self, params: dict[str, JsonValue]) -> dict[str, JsonValue]:
         """Handle tools/call request - execute tool."""
         name_value = params.get("name", "")
@@ -100,13 +1158,13 @@ class MCPServer:
 
         name: str = name_value
 
-        if name == "read":
-            # Extract arguments from params
-            arguments = params.get("arguments", {})
+        # Extract arguments from params
+        arguments = params.get("arguments", {})
 
-            if not isinstance(arguments, dict):
-                raise ValueError("Tool arguments must be an object")
+        if not isinstance(arguments, dict):
+            raise ValueError("Tool arguments must be an object")
 
+        if name == "read":
             # Get file_path from arguments
             file_path_value = arguments.get("file_path", "")
 
@@ -115,19 +1173,35 @@ class MCPServer:
 
             file_path: str = file_path_value
 
-            # Handle CLAUDE_PLUGIN_ROOT special case
-            if file_path == "CLAUDE_PLUGIN_ROOT":
-                plugin_root = str(Path.cwd())
+            include_dependencies = arguments.get("include_dependencies", False)
+
+            if not isinstance(include_dependencies, bool):
+                raise ValueError("include_dependencies must be a boolean")
+
+            heading_path = self.parse_heading_path(arguments)
+
+            max_bytes = arguments.get("max_bytes")
+
+            if max_bytes is not None and (not isinstance(max_bytes, int) or isinstance(max_bytes, bool) or max_bytes < 1):
+                raise ValueError("max_bytes must be a positive integer")
 
+            if include_dependencies and heading_path:
+                raise ValueError("section/heading_path cannot be combined with include_dependencies")
+
+            if include_dependencies and file_path != "CLAUDE_PLUGIN_ROOT":
                 return {
-                    "content": [{
-                        "type": "text",
-                        "text": plugin_root
-                    }]
+                    "content": self.read_with_dependencies(file_path, max_bytes)
                 }
 
-            # Read file content
-            content = self.read_file(file_path)
+            # Read file content (or just the requested section)
+            if heading_path and file_path != "CLAUDE_PLUGIN_ROOT":
+                key, _ = self.resolve(file_path)
+                content = self.sections.extract(key, heading_path)
+            else:
+                content = self.read_tool_text(file_path)
+
+            if max_bytes is not None:
+                content = self.truncate(content, max_bytes)
 
             return {
                 "content": [{
@@ -135,11 +1209,200 @@ class MCPServer:
                     "text": content
                 }]
             }
+        elif name == "read_many":
+            # Get file_paths from arguments
+            file_paths_value = arguments.get("file_paths", [])
+
+            if not isinstance(file_paths_value, list):
+                raise ValueError("file_paths must be an array of strings")
+
+            file_paths: list[str] = [item for item in file_paths_value if isinstance(item, str)]
+
+            if len(file_paths) != len(file_paths_value):
+                raise ValueError("file_paths must be an array of strings")
+
+            # One block per file, headed by its canonical URI like dependency reads;
+            # failures are reported inline (with the requested path) instead of failing the batch
+            blocks: list[JsonValue] = []
+            for file_path in file_paths:
+                try:
+                    if file_path == "CLAUDE_PLUGIN_ROOT":
+                        header = file_path
+                    else:
+                        key, _ = self.resolve(file_path)
+                        header = RESOURCE_URI_PREFIX + key
+                    text = f"<!-- {header} -->\n{self.read_tool_text(file_path)}"
+                except (FileNotFoundError, ValueError) as e:
+                    text = f"Error: {e}"
+
+                blocks.append({
+                    "type": "text",
+                    "text": text
+                })
+
+            return {
+                "content": blocks
+            }
+        elif name == "next_state":
+            state = arguments.get("state", "")
+            code = arguments.get("code")
+            orchestration = arguments.get("orchestration")
+
+            if not isinstance(state, str) or not state.strip():
+                raise ValueError("state must be a non-empty string")
+
+            if code is not None and not isinstance(code, str):
+                raise ValueError("code must be a string")
+
+            if orchestration is not None and not isinstance(orchestration, str):
+                raise ValueError("orchestration must be a string")
+
+            result = self.state_machine.next_state(state, code, orchestration)
+
+            return {
+                "content": [{
+                    "type": "text",
+                    "text": json.dumps(result, indent=2, ensure_ascii=False)
+                }]
+            }
+        elif name == "stats":
+            top = arguments.get("top", STATS_TOP_FILES)
+
+            if not isinstance(top, int) or isinstance(top, bool) or top < 1:
+                raise ValueError("top must be a positive integer")
+
+            return {
+                "content": [{
+                    "type": "text",
+                    "text": json.dumps(self.stats(top), indent=2, ensure_ascii=False)
+                }]
+            }
         else:
             raise ValueError(f"Unknown tool: {name}")
 
+    def handle_resources_list(self, params: dict[str, JsonValue]) -> dict[str, JsonValue]:
+        """Handle resources/list request - list resources from the manifest with cursor pagination."""
+        cursor_value = params.get("cursor")
+
+        # Cursor is an opaque offset into the sorted manifest
+        offset = 0
+        if cursor_value is not None:
+            if not isinstance(cursor_value, str) or not cursor_value.isdigit():
+                raise ValueError(f"Invalid cursor: {cursor_value}")
+            offset = int(cursor_value)
+
+        descriptors = self.manifest.resources()
+        page: list[JsonValue] = list(descriptors[offset:offset + MANIFEST_PAGE_SIZE])
+
+        result: dict[str, JsonValue] = {
+            "resources": page
+        }
+        if offset + MANIFEST_PAGE_SIZE < len(descriptors):
+            result["nextCursor"] = str(offset + MANIFEST_PAGE_SIZE)
+
+        return result
+
+    def handle_resources_read(self, params: dict[str, JsonValue]) -> dict[str, JsonValue]:
+        """Handle resources/read request - read one resource, or every resource under a URI ending in '/'."""
+        uri_value = params.get("uri", "")
+
+        if not isinstance(uri_value, str) or not uri_value:
+            raise ValueError("uri must be a non-empty string")
+
+        uri: str = uri_value
+
+        contents: list[JsonValue] = []
+
+        # Directory URI: return the whole bundle below it in one response
+        if uri.endswith("/") or uri == RESOURCE_URI_PREFIX:
+            prefix = uri[len(RESOURCE_URI_PREFIX):] if uri.startswith(RESOURCE_URI_PREFIX) else uri
+            prefix = prefix.lstrip("/").casefold()
+
+            self.index.refresh()
+            for key in sorted(self.index.files):
+                if key.casefold().startswith(prefix):
+                    contents.append({
+                        "uri": RESOURCE_URI_PREFIX + key,
+                        "mimeType": RESOURCE_MIME_TYPE,
+                        "text": self.read_file(key)
+                    })
+
+            if not contents:
+                raise FileNotFoundError(f"Resource not found: {uri}")
+        else:
+            contents.append({
+                "uri": uri,
+                "mimeType": RESOURCE_MIME_TYPE,
+                "text": self.read_file(uri)
+            })
+
+        return {
+            "contents": contents
+        }
+
+    def handle_resources_templates_list(self, _: dict[str, JsonValue]) -> dict[str, JsonValue]:
+        """Handle resources/templates/list request - describe the resource URI scheme."""
+        return {
+            "resourceTemplates": [{
+                "uriTemplate": RESOURCE_URI_PREFIX + "{path}",
+                "name": "orchestrator-resource",
+                "description": "Orchestrator Markdown resource (path relative to resources directory)",
+                "mimeType": RESOURCE_MIME_TYPE
+            }]
+        }
+
+    def collect_metrics(self) -> None:
+        """Refresh the series read on demand (cache counters, index size, in-flight requests)."""
+        cache = self.cache.stats()
+        self.metrics.count("cache_hits_total", cache["hits"])  # type: ignore[arg-type]
+        self.metrics.count("cache_misses_total", cache["misses"])  # type: ignore[arg-type]
+        self.metrics.set("cache_entries", cache["entries"])  # type: ignore[arg-type]
+        self.metrics.set("indexed_files", len(self.index.files))
+        self.metrics.set("requests_in_flight", len(self.in_flight))
+
+    def stats(self, top: int = STATS_TOP_FILES) -> dict[str, JsonValue]:
+        """Metrics snapshot for the stats tool, with per-file read counts reduced to the top entries."""
+        snapshot = self.metrics.snapshot()
+        snapshot["counters"].pop("file_reads_total", None)
+        latency = snapshot["histograms"].get("request_duration_ms", {})
+
+        return {
+            "server": self.name,
+            "pid": os.getpid(),
+            "mode": self.mode,
+            "requests": {label: histogram["count"] for label, histogram in latency.items()},
+            **snapshot,
+            "top_files": [{"file": key, "reads": int(reads)} for key, reads in self.metrics.top("file_reads_total", top)]
+        }
+
+    @staticmethod
+    def method_label(request: dict[str, JsonValue]) -> str:
+        """Bounded label for per-method metrics (tools/call is split by tool name)."""
+        method = request.get("method")
+
+        if method == "tools/call":
+            params = request.get("params")
+            tool = params.get("name") if isinstance(params, dict) else None
+            return f"tools/call:{tool}" if tool in TOOL_NAMES else "tools/call"
+
+        return method if isinstance(method, str) and method in STATS_METHODS else "other"
+
     def handle_request(self, request: dict[str, JsonValue]) -> dict[str, JsonValue]:
-        """Handle incoming JSON-RPC request."""
+        """Handle incoming JSON-RPC request (counted and timed per method for the stats tool)."""
+        start = time.perf_counter()
+        response = self.route_request(request)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        # The histogram count doubles as the request counter
+        label = self.method_label(request)
+        self.metrics.observe("request_duration_ms", elapsed_ms, label)
+        if "error" in response:
+            self.metrics.inc("errors_total", label)
+
+        return response
+
+    def route_request(self, request: dict[str, JsonValue]) -> dict[str, JsonValue]:
+        """Dispatch a JSON-RPC request to its handler and build the response."""
         method_value = request.get("method", "")
         method = method_value if isinstance(method_value, str) else ""
 
@@ -158,11 +1421,17 @@ class MCPServer:
             elif method == "notifications/initialized":
                 result = self.handle_noop()
             elif method == "notifications/cancelled":
-                result = self.handle_noop()
+                result = self.handle_cancelled(params)
             elif method == "tools/list":
                 result = self.handle_tools_list(params)
             elif method == "tools/call":
                 result = self.handle_tools_call(params)
+            elif method == "resources/list":
+                result = self.handle_resources_list(params)
+            elif method == "resources/read":
+                result = self.handle_resources_read(params)
+            elif method == "resources/templates/list":
+                result = self.handle_resources_templates_list(params)
             else:
                 response: dict[str, JsonValue] = {
                     "jsonrpc": "2.0",
@@ -221,70 +1490,326 @@ class MCPServer:
                 response["id"] = request.get("id")
             return response
 
-    def run(self) -> None:
-        """Run the MCP server - read from stdin, write to stdout."""
-        # Use line-buffered mode for stdio
-        # Type ignore needed because TextIO doesn't expose reconfigure in type stubs
-        sys.stdin.reconfigure(line_buffering=True)  # type: ignore[attr-defined]
-        sys.stdout.reconfigure(line_buffering=True)  # type: ignore[attr-defined]
+    def send(self, response: dict[str, JsonValue]) -> None:
+        """Write one response as a JSON line (encoded once, serialized so concurrent writers never interleave)."""
+        data = self.writer.send(response)
+        self.metrics.inc("response_bytes_total", amount=len(data))
+
+        # Debug: Log outgoing response (decoded only when DEBUG is enabled)
+        logger.debug("Sending: %s", transport.Preview(data))
+
+    def send_raw(self, data: bytes) -> None:
+        """Write pre-encoded response line(s) through the same serialized writer."""
+        self.writer.write(data)
+
+    @staticmethod
+    def parse_error(error: json.JSONDecodeError) -> dict[str, JsonValue]:
+        """Build the response for a line that is not valid JSON (no id, as per JSON-RPC spec)."""
+        return {
+            "jsonrpc": "2.0",
+            "error": {
+                "code": -32700,
+                "message": f"Parse error: {str(error)}"
+            }
+        }
+
+    def process_line(self, line: bytes | None) -> dict[str, JsonValue] | None:
+        """Parse and handle one JSON-RPC frame. Returns None when no response is due (notifications).
 
+        None is an oversized frame already discarded by transport.read_frames().
+        """
+        if line is None:
+            return transport.oversized_frame_error()
+
+        try:
+            request = transport.parse(line)
+        except json.JSONDecodeError as e:
+            logger.debug("Parse error: %s", e)
+            return self.parse_error(e)
+
+        return self.handle_request(request) or None
+
+    def dispatch(self, executor: ThreadPoolExecutor, request: dict[str, JsonValue]) -> bool:
+        """Submit a request to the worker pool. Returns False if it must be handled inline."""
+        request_id = request.get("id")
+
+        if request.get("method") not in CONCURRENT_METHODS or not isinstance(request_id, (str, int)):
+            return False
+
+        with self._in_flight_lock:
+            future = executor.submit(self.handle_request, request)
+            self.in_flight[request_id] = future
+
+        future.add_done_callback(lambda done: self.complete(request_id, done))
+        return True
+
+    def complete(self, request_id: str | int, future: Future[dict[str, JsonValue]]) -> None:
+        """Send the response of a finished worker request unless it was cancelled."""
+        with self._in_flight_lock:
+            if self.in_flight.get(request_id) is future:
+                del self.in_flight[request_id]
+
+            if request_id in self.cancelled:
+                self.cancelled.discard(request_id)
+                logger.debug("Dropped response for cancelled request %s", request_id)
+                return
+
+        try:
+            response = future.result()
+        except Exception as e:
+            logger.error("Worker error for request %s: %s", request_id, e)
+            response = {
+                "jsonrpc": "2.0",
+                "error": {
+                    "code": -32603,
+                    "message": f"Internal error: {str(e)}"
+                },
+                "id": request_id
+            }
+
+        self.send(response)
+
+    def run(self) -> None:
+        """Run the MCP server - read frames from binary stdin, write to binary stdout."""
         # Debug: Log server start
-        print(f"[DEBUG] MCP server '{self.name}' starting...", file=sys.stderr)
+        logger.debug("MCP server '%s' starting...", self.name)
 
-        for line in sys.stdin:
-            line = line.strip()
-            if not line:
+        # Optional Prometheus textfile (RESIN_AI_METRICS_INTERVAL)
+        exporter = metrics.start_exporter(self.metrics, "resources")
+
+        # Concurrent mode: slow reads run on workers, everything else stays inline on this thread
+        executor = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="resources") if WORKERS > 0 else None
+        if executor is not None:
+            logger.debug("Concurrent mode: %s workers", WORKERS)
+
+        for line in transport.read_frames(sys.stdin.buffer):
+            if line is None:
+                logger.debug("Discarded frame over %s bytes", transport.MAX_FRAME_BYTES)
+                self.send(transport.oversized_frame_error())
                 continue
 
             # Debug: Log incoming request
-            print(f"[DEBUG] Received: {line[:200]}{'...' if len(line) > 200 else ''}", file=sys.stderr)
+            logger.debug("Received: %s", transport.Preview(line))
 
             try:
-                request = json.loads(line)
+                request = transport.parse(line)
+
+                if executor is not None and isinstance(request, dict) and self.dispatch(executor, request):
+                    continue
+
                 response = self.handle_request(request)
 
                 # Skip empty responses (notifications don't get responses)
                 if not response:
-                    print("[DEBUG] No response needed (notification)", file=sys.stderr)
+                    logger.debug("No response needed (notification)")
                     continue
 
-                # Debug: Log outgoing response
-                response_str = json.dumps(response)
-                print(f"[DEBUG] Sending: {response_str[:200]}{'...' if len(response_str) > 200 else ''}", file=sys.stderr)
-
-                # Write response as JSON line
-                json.dump(response, sys.stdout)
-                sys.stdout.write('\n')
-                sys.stdout.flush()
+                self.send(response)
 
             except json.JSONDecodeError as e:
                 # Debug: Log parse error
-                print(f"[DEBUG] Parse error: {str(e)}", file=sys.stderr)
+                logger.debug("Parse error: %s", e)
 
                 # Invalid JSON - send error response without id (as per JSON-RPC spec)
-                error_response: dict[str, JsonValue] = {
-                    "jsonrpc": "2.0",
-                    "error": {
-                        "code": -32700,
-                        "message": f"Parse error: {str(e)}"
-                    }
-                }
-                json.dump(error_response, sys.stdout)
-                sys.stdout.write('\n')
-                sys.stdout.flush()
+                self.send(self.parse_error(e))
             except Exception as e:
                 # Unexpected error - log to stderr (not stdout, which is for MCP protocol)
-                print(f"[DEBUG] Fatal error: {e}", file=sys.stderr)
-                import traceback
-                traceback.print_exc(file=sys.stderr)
+                logger.exception("Fatal error: %s", e)
                 break
 
-        print(f"[DEBUG] MCP server '{self.name}' stopped.", file=sys.stderr)
+        # Let in-flight requests finish and flush their responses
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+        # Carry anything rescanned during this session over to the next one
+        self.persist()
+
+        if exporter is not None:
+            exporter.stop()
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Cache stats: %s", self.cache.stats())
+        logger.debug("MCP server '%s' stopped.", self.name)
+
+
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+    """Serve one proxied session: JSON-RPC lines in, JSON-RPC lines out."""
+
+    def handle(self) -> None:
+        daemon: ResourceDaemon = self.server.resource_daemon  # type: ignore[attr-defined]
+        daemon.connection_opened()
+
+        try:
+            for line in transport.read_frames(self.rfile):
+                response = daemon.server.process_line(line)
+                if response:
+                    data = transport.encode(response)
+                    self.wfile.write(data)
+                    daemon.server.metrics.inc("response_bytes_total", amount=len(data))
+        except OSError as e:
+            logger.warning("Daemon connection error: %s", e)
+        finally:
+            daemon.connection_closed()
+
+
+class ResourceDaemon:
+    """Host-wide resources server on a Unix socket, shared by every session.
+
+    One long-lived process owns the cache, index and derived data; per-session
+    stdio entry points become thin proxies that forward JSON-RPC lines. The
+    daemon holds an flock on a lock file next to the socket so at most one runs
+    per plugin root, and exits after DAEMON_IDLE_TIMEOUT without connections.
+    """
+
+    def __init__(self, server: MCPServer, socket_path: Path) -> None:
+        self.server = server
+        self.socket_path = socket_path
+        self.connections = 0
+        self.last_activity = time.monotonic()
+        self._lock = threading.Lock()
+
+    def connection_opened(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+    def connection_closed(self) -> None:
+        with self._lock:
+            self.connections -= 1
+            self.last_activity = time.monotonic()
+
+    def _reap_when_idle(self, unix_server: socketserver.BaseServer) -> None:
+        """Stop the daemon once it has had no connections for DAEMON_IDLE_TIMEOUT seconds."""
+        while True:
+            time.sleep(min(60, DAEMON_IDLE_TIMEOUT))
+            with self._lock:
+                idle = self.connections == 0 and time.monotonic() - self.last_activity > DAEMON_IDLE_TIMEOUT
+            if idle:
+                logger.debug("Resources daemon idle, shutting down")
+                unix_server.shutdown()
+                return
+
+    def serve(self) -> None:
+        """Run the daemon until idle (no-op if another daemon already owns the socket)."""
+        import fcntl
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        lock_handle = open(self.socket_path.with_suffix('.lock'), 'a')
+
+        try:
+            fcntl.flock(lock_handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            logger.debug("Resources daemon already running")
+            lock_handle.close()
+            return
+
+        exporter: metrics.TextfileExporter | None = None
+
+        try:
+            # We hold the lock, so any existing socket file is stale
+            try:
+                self.socket_path.unlink()
+            except FileNotFoundError:
+                pass
+
+            self.server.mode = "daemon"
+            self.server.warm_start()
+            exporter = metrics.start_exporter(self.server.metrics, "resources-daemon")
+
+            with socketserver.ThreadingUnixStreamServer(str(self.socket_path), DaemonRequestHandler) as unix_server:
+                unix_server.daemon_threads = True
+                unix_server.resource_daemon = self  # type: ignore[attr-defined]
+                threading.Thread(target=self._reap_when_idle, args=(unix_server,), daemon=True).start()
+
+                logger.debug("Resources daemon listening on %s", self.socket_path)
+                unix_server.serve_forever()
+        finally:
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
+            if exporter is not None:
+                exporter.stop()
+            self.server.persist()
+            lock_handle.close()
+
+    def spawn(self) -> None:
+        """Start a detached daemon in the background (best effort) for future sessions."""
+        try:
+            subprocess.Popen(
+                [sys.executable, str(Path.cwd() / 'resources.py'), '--daemon'],
+                cwd=str(Path.cwd()),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
+            )
+        except OSError as e:
+            logger.warning("Failed to start resources daemon: %s", e)
+
+    def proxy(self) -> bool:
+        """Forward stdio to the daemon. Returns False if no daemon is listening.
+
+        If the daemon goes away mid-session the remaining requests are served
+        in-process (responses still owed by the daemon are lost).
+        """
+        try:
+            connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            connection.connect(str(self.socket_path))
+        except OSError:
+            connection.close()
+            return False
+
+        logger.debug("Proxying to resources daemon at %s", self.socket_path)
+
+        def pump() -> None:
+            with connection.makefile('rb') as reader:
+                for line in reader:
+                    self.server.send_raw(line)
+
+        pump_thread = threading.Thread(target=pump, daemon=True)
+        pump_thread.start()
+
+        connected = True
+        for line in transport.read_frames(sys.stdin.buffer):
+            if connected and line is not None:
+                try:
+                    connection.sendall(line + b'\n')
+                    continue
+                except OSError as e:
+                    connected = False
+                    logger.debug("Resources daemon unavailable (%s), serving in-process", e)
+
+            response = self.server.process_line(line)
+            if response:
+                self.server.send(response)
+
+        # Half-close so the daemon flushes the remaining responses, then wait for them
+        try:
+            connection.shutdown(socket.SHUT_WR)
+        except OSError:
+            pass
+
+        pump_thread.join(timeout=5)
+        connection.close()
+        return True
 
 
 def main() -> None:
     """Main entry point."""
     server = MCPServer("resin-ai-orchestrator-resources")
+    daemon = ResourceDaemon(server, DAEMON_SOCKET_PATH)
+
+    if "--daemon" in sys.argv[1:]:
+        daemon.serve()
+        return
+
+    if DAEMON_MODE:
+        if daemon.proxy():
+            return
+
+        # No daemon yet: start one for the next sessions and serve this one in-process
+        daemon.spawn()
+
     server.run()
 
 
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Shared stderr logging for the orchestrator MCP servers
+
+Zero-dependency logging setup used by resources.py and ping-pong.py (stdout is
+reserved for the MCP protocol, so everything goes to stderr).
+
+- RESIN_AI_DEBUG=1: emit DEBUG records (default level is INFO)
+- RESIN_AI_TRACE=<N>: keep the last N records below the output level in a ring
+  buffer and dump them to stderr when an ERROR is logged, so failures come with
+  full context without paying for debug output in normal operation
+
+Callers pass %-style arguments (logger.debug("Sent %s", value)) so messages are
+only formatted when a handler actually emits them, and guard anything expensive
+to compute with logger.isEnabledFor(logging.DEBUG).
+
+Requires Python 3.10+
+
+Updated: 2026-10-18 18:36:05 UTC
+"""
+
+import logging
+import os
+import sys
+import threading
+from collections import deque
+
+LOG_FORMAT = '[%(levelname)s] %(message)s'
+
+
+class TraceBuffer(logging.Handler):
+    """Ring buffer of suppressed records, dumped through the output handler on ERROR.
+
+    Records are kept unformatted (message arguments are only rendered on dump),
+    so buffering costs one deque append per record.
+    """
+
+    def __init__(self, capacity: int, output: logging.Handler) -> None:
+        super().__init__(logging.DEBUG)
+        self.records: deque[logging.LogRecord] = deque(maxlen=capacity)
+        self.output = output
+        self._buffer_lock = threading.Lock()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.levelno >= logging.ERROR:
+            self.dump()
+        elif record.levelno < self.output.level:
+            with self._buffer_lock:
+                self.records.append(record)
+
+    def dump(self) -> None:
+        """Write the buffered records to the output handler and clear the buffer."""
+        with self._buffer_lock:
+            records = list(self.records)
+            self.records.clear()
+
+        if not records:
+            return
+
+        self.output.stream.write(f"[TRACE] ---- last {len(records)} records before error ----\n")  # type: ignore[attr-defined]
+        for record in records:
+            self.output.stream.write(f"[TRACE] {self.output.format(record)}\n")  # type: ignore[attr-defined]
+        self.output.stream.write("[TRACE] ---- end of trace ----\n")  # type: ignore[attr-defined]
+        self.output.flush()
+
+
+def trace_capacity() -> int:
+    """Ring buffer size from RESIN_AI_TRACE (0 = disabled)."""
+    try:
+        return max(0, int(os.environ.get('RESIN_AI_TRACE', '0')))
+    except ValueError:
+        return 0
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Return the named server logger, configured once for stderr output."""
+    logger = logging.getLogger(name)
+    if logger.handlers:
+        return logger
+
+    # Use INFO level by default (set RESIN_AI_DEBUG=1 for DEBUG level)
+    level = logging.DEBUG if os.environ.get('RESIN_AI_DEBUG') == '1' else logging.INFO
+
+    output = logging.StreamHandler(sys.stderr)
+    output.setFormatter(logging.Formatter(LOG_FORMAT))
+    output.setLevel(level)
+    logger.addHandler(output)
+
+    capacity = trace_capacity()
+    if capacity and level > logging.DEBUG:
+        # Records below the output level must still be created to be buffered
+        logger.addHandler(TraceBuffer(capacity, output))
+        logger.setLevel(logging.DEBUG)
+    else:
+        logger.setLevel(level)
+
+    logger.propagate = False
+    return logger
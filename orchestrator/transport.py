@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Shared JSON-RPC stdio transport for the orchestrator MCP servers
+
+Zero-dependency framing used by resources.py and ping-pong.py: one JSON message
+per line (MCP stdio transport), handled as bytes end to end.
+
+- encode() serializes a message once (compact separators, ensure_ascii=False)
+  straight to a UTF-8 line, so a large resource response is not escaped,
+  re-encoded or split into several small writes
+- Writer emits each encoded line with a single write + flush on the binary
+  stdout, serialized so concurrent senders never interleave
+- read_frames() reads stdin in binary with a bounded line reader: a frame
+  longer than MAX_FRAME_BYTES is discarded up to its newline and reported as
+  None instead of being buffered in full
+
+RESIN_AI_MAX_FRAME_BYTES overrides the frame limit (default 4 MiB).
+
+Requires Python 3.10+
+
+Updated: 2026-10-18 19:24:48 UTC
+"""
+
+import json
+import os
+import sys
+import threading
+from collections.abc import Iterator
+from typing import Any, BinaryIO
+
+DEFAULT_MAX_FRAME_BYTES = 4 * 1024 * 1024
+DISCARD_CHUNK_BYTES = 64 * 1024  # read size while skipping the rest of an oversized frame
+PREVIEW_BYTES = 200  # bytes of a frame shown in debug logs
+
+# JSON-RPC error code for a frame that exceeds the limit (sent without id, like a parse error)
+INVALID_REQUEST = -32600
+
+
+def max_frame_bytes() -> int:
+    """Frame limit from RESIN_AI_MAX_FRAME_BYTES (invalid or non-positive values use the default)."""
+    try:
+        value = int(os.environ.get('RESIN_AI_MAX_FRAME_BYTES', '0'))
+    except ValueError:
+        return DEFAULT_MAX_FRAME_BYTES
+    return value if value > 0 else DEFAULT_MAX_FRAME_BYTES
+
+
+MAX_FRAME_BYTES = max_frame_bytes()
+
+
+def encode(message: Any) -> bytes:
+    """Serialize one message to a newline-terminated UTF-8 JSON line."""
+    try:
+        return json.dumps(message, separators=(',', ':'), ensure_ascii=False).encode('utf-8') + b'\n'
+    except UnicodeEncodeError:
+        # Lone surrogates cannot be written as UTF-8; fall back to \u escapes
+        return json.dumps(message, separators=(',', ':')).encode('ascii') + b'\n'
+
+
+def parse(frame: bytes) -> Any:
+    """Parse one frame; invalid UTF-8 is replaced so only json.JSONDecodeError is raised."""
+    return json.loads(frame.decode('utf-8', errors='replace'))
+
+
+def oversized_frame_error(limit: int = MAX_FRAME_BYTES) -> dict[str, Any]:
+    """Response for a discarded oversized frame (no id: the request was never parsed)."""
+    return {
+        "jsonrpc": "2.0",
+        "error": {
+            "code": INVALID_REQUEST,
+            "message": f"Invalid Request: message exceeds {limit} bytes"
+        }
+    }
+
+
+def read_frames(stream: BinaryIO, limit: int = MAX_FRAME_BYTES) -> Iterator[bytes | None]:
+    """Yield stripped, non-empty lines from a binary stream until EOF.
+
+    Lines longer than limit bytes are consumed up to their newline without
+    being kept in memory and yielded as None so the caller can reply with
+    oversized_frame_error().
+    """
+    while True:
+        line = stream.readline(limit + 1)
+        if not line:
+            return
+
+        if len(line) > limit and not line.endswith(b'\n'):
+            # Skip the remainder of the frame in bounded chunks
+            while not line.endswith(b'\n'):
+                line = stream.readline(DISCARD_CHUNK_BYTES)
+                if not line:
+                    break
+            yield None
+            continue
+
+        line = line.strip()
+        if line:
+            yield line
+
+
+class Preview:
+    """Lazy log argument: the first PREVIEW_BYTES of a frame, decoded only if the record is emitted."""
+
+    __slots__ = ('data',)
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+
+    def __str__(self) -> str:
+        data = self.data.rstrip(b'\n')
+        text = data[:PREVIEW_BYTES].decode('utf-8', errors='replace')
+        return text + '...' if len(data) > PREVIEW_BYTES else text
+
+
+class Writer:
+    """Serialized writer of encoded lines to a binary stream (stdout by default)."""
+
+    def __init__(self, stream: BinaryIO | None = None) -> None:
+        self.stream = stream if stream is not None else sys.stdout.buffer
+        self._lock = threading.Lock()
+
+    def send(self, message: Any) -> bytes:
+        """Encode and write one message; returns the encoded line."""
+        data = encode(message)
+        self.write(data)
+        return data
+
+    def write(self, data: bytes) -> None:
+        """Write pre-encoded line(s) in one call and flush."""
+        with self._lock:
+            self.stream.write(data)
+            self.stream.flush()